@@ -15,6 +15,7 @@ import gradio as gr
 import yaml
 
 from elt_llm_core.config import RagConfig
+from elt_llm_core.vector_store import DOCSTORE_NODES_FILE
 from elt_llm_ingest.ingest import ingest_from_config
 from elt_llm_query.query import query_collection, query_collections, resolve_collection_prefixes
 
@@ -107,8 +108,9 @@ def get_status() -> str:
                 continue
             count = col.count()
             total_chunks += count
-            ds_path = docstore_dir / col.name / "docstore.json"
-            bm25 = "✅" if ds_path.exists() else "❌"
+            ds_dir = docstore_dir / col.name
+            has_docstore = (ds_dir / DOCSTORE_NODES_FILE).exists() or (ds_dir / "docstore.json").exists()
+            bm25 = "✅" if has_docstore else "❌"
             lines.append(f"| `{col.name}` | {count} | {bm25} |")
 
         lines.append(f"\n_Total: {len(collections)} collections, {total_chunks} chunks_")
@@ -72,7 +72,7 @@ for _noisy_lib in ("llama_index", "httpx", "httpcore", "backoff", "urllib3"):
 logging.getLogger("llama_index").propagate = False
 
 from elt_llm_core.config import RagConfig
-from elt_llm_core.vector_store import get_docstore_path
+from elt_llm_core.vector_store import get_docstore_path, load_docstore_nodes
 from elt_llm_query.query import discover_relevant_sections, expand_entity_aliases, find_sections_by_keyword, query_collections
 
 # ---------------------------------------------------------------------------
@@ -309,7 +309,6 @@ def extract_handbook_terms_from_docstore(rag_config: RagConfig) -> list[dict]:
     - Table rows: '|TERM|means DEFINITION|' (Definitions/Interpretation tables,
       including multi-line terms with <br> separators)
     """
-    from llama_index.core import StorageContext
     from elt_llm_core.vector_store import create_chroma_client, list_collections_by_prefix
     import re as _re
 
@@ -326,8 +325,7 @@ def extract_handbook_terms_from_docstore(rag_config: RagConfig) -> list[dict]:
             ds_path = get_docstore_path(rag_config.chroma, col)
             if not ds_path.exists():
                 continue
-            storage = StorageContext.from_defaults(persist_dir=str(ds_path))
-            all_nodes.extend(storage.docstore.docs.values())
+            all_nodes.extend(load_docstore_nodes(ds_path))
         nodes = all_nodes
     else:
         # Legacy fallback: monolithic fa_handbook collection
@@ -340,8 +338,7 @@ def extract_handbook_terms_from_docstore(rag_config: RagConfig) -> list[dict]:
             )
             sys.exit(1)
         print(f"  Loading fa_handbook docstore (legacy): {docstore_path}")
-        storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
-        nodes = list(storage.docstore.docs.values())
+        nodes = load_docstore_nodes(docstore_path)
 
     print(f"  {len(nodes)} nodes loaded from handbook docstore(s)")
 
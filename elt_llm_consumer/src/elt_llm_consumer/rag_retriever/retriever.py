@@ -12,7 +12,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from elt_llm_core.config import RagConfig
-from elt_llm_core.vector_store import get_docstore_path
+from elt_llm_core.vector_store import get_docstore_path, load_docstore_nodes
 from elt_llm_query.query import (
     find_sections_by_keyword,
     load_index,
@@ -65,7 +65,6 @@ def _score_sections_bm25(
     an alias drove the score.
     """
     try:
-        from llama_index.core import StorageContext
         from llama_index.retrievers.bm25 import BM25Retriever
         import logging as _logging
         _logging.getLogger("bm25s").setLevel(_logging.WARNING)
@@ -85,9 +84,7 @@ def _score_sections_bm25(
         if not docstore_path.exists():
             continue
         try:
-            from llama_index.core import StorageContext
-            storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
-            nodes = list(storage.docstore.docs.values())
+            nodes = load_docstore_nodes(docstore_path)
             if not nodes:
                 continue
 
@@ -134,7 +131,6 @@ def _retrieve_candidate_pool(
     Returns:
         List of NodeWithScore, sorted by fusion score descending.
     """
-    from llama_index.core import StorageContext
     from llama_index.core.schema import NodeWithScore
 
     full_ctx_threshold = rag_config.query.full_context_max_chunks
@@ -154,8 +150,7 @@ def _retrieve_candidate_pool(
         docstore_path = get_docstore_path(rag_config.chroma, name)
         if full_ctx_threshold > 0 and docstore_path.exists():
             try:
-                ds = StorageContext.from_defaults(persist_dir=str(docstore_path))
-                doc_nodes = list(ds.docstore.docs.values())
+                doc_nodes = load_docstore_nodes(docstore_path)
                 if 0 < len(doc_nodes) <= full_ctx_threshold:
                     all_nodes.extend(NodeWithScore(node=n, score=1.0) for n in doc_nodes)
                     continue
@@ -11,6 +11,9 @@ import yaml
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed loader when PyYAML was built with it, pure-Python otherwise
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
 
 @dataclass
 class ChromaConfig:
@@ -20,11 +23,15 @@ class ChromaConfig:
         persist_dir: Directory for persistent storage.
         tenant: Chroma tenant name.
         database: Chroma database name.
+        json_docstore: Also persist the BM25 nodes as a JSON
+            ``SimpleDocumentStore`` (``docstore.json``) next to the binary
+            snapshot, for tools that read the JSON directly.
     """
 
     persist_dir: str = "./chroma_db"
     tenant: str = "default_tenant"
     database: str = "default_database"
+    json_docstore: bool = True
 
 
 @dataclass
@@ -36,6 +43,7 @@ class OllamaConfig:
         embedding_model: Name of the embedding model.
         llm_model: Name of the LLM model.
         embed_batch_size: Batch size for embeddings.
+        embed_num_workers: Embedding batches sent to Ollama concurrently.
         context_window: Context window size for LLM.
         request_timeout: Request timeout in seconds.
         num_predict: Max tokens to generate (-1 = unlimited). Set to cap response length
@@ -46,6 +54,7 @@ class OllamaConfig:
     embedding_model: str = "nomic-embed-text"
     llm_model: str = "llama3.2"
     embed_batch_size: int = 10
+    embed_num_workers: int = 4
     context_window: int = 4096
     request_timeout: float = 60.0
     num_predict: int = -1
@@ -118,31 +127,42 @@ class RagConfig:
     query: QueryConfig = field(default_factory=QueryConfig)
 
     @classmethod
-    def from_dict(cls, data: dict[str, Any]) -> "RagConfig":
+    def from_dict(cls, data: dict[str, Any], base_dir: str | Path | None = None) -> "RagConfig":
         """Create RagConfig from a dictionary.
 
         Args:
-            data: Dictionary with configuration.
+            data: Dictionary with configuration (e.g. an already-parsed YAML document).
+            base_dir: Directory that a relative ``chroma.persist_dir`` is resolved
+                against — normally the directory of the YAML file. Left as-is if None.
 
         Returns:
             RagConfig instance.
+
+        Raises:
+            ValueError: If data is not a dictionary.
         """
+        if not isinstance(data, dict):
+            logger.error("Configuration must be a YAML dictionary")
+            raise ValueError("Configuration must be a YAML dictionary")
+
         chroma_data = data.get("chroma", {})
         ollama_data = data.get("ollama", {})
         chunking_data = data.get("chunking", {})
         query_data = data.get("query", {})
 
-        return cls(
+        config = cls(
             chroma=ChromaConfig(
                 persist_dir=chroma_data.get("persist_dir", "./chroma_db"),
                 tenant=chroma_data.get("tenant", "default_tenant"),
                 database=chroma_data.get("database", "default_database"),
+                json_docstore=chroma_data.get("json_docstore", True),
             ),
             ollama=OllamaConfig(
                 base_url=ollama_data.get("base_url", "http://localhost:11434"),
                 embedding_model=ollama_data.get("embedding_model", "nomic-embed-text"),
                 llm_model=ollama_data.get("llm_model", "llama3.2"),
                 embed_batch_size=ollama_data.get("embed_batch_size", 10),
+                embed_num_workers=ollama_data.get("embed_num_workers", 4),
                 context_window=ollama_data.get("context_window", 4096),
                 request_timeout=ollama_data.get("request_timeout", 60.0),
                 num_predict=ollama_data.get("num_predict", -1),
@@ -173,6 +193,13 @@ class RagConfig:
             ),
         )
 
+        if base_dir is not None:
+            chroma_dir = str(config.chroma.persist_dir)
+            if not chroma_dir.startswith(("~", "/")):
+                config.chroma.persist_dir = str((Path(base_dir) / chroma_dir).resolve())
+
+        return config
+
     @classmethod
     def from_yaml(cls, path: str | Path) -> "RagConfig":
         """Load configuration from a YAML file.
@@ -195,20 +222,10 @@ class RagConfig:
 
         logger.info("Loading configuration from: %s", config_path)
 
-        with open(config_path) as f:
-            data = yaml.safe_load(f)
-
-        if not isinstance(data, dict):
-            logger.error("Configuration must be a YAML dictionary")
-            raise ValueError("Configuration must be a YAML dictionary")
-
-        config = cls.from_dict(data)
+        with open(config_path, "rb") as f:
+            data = yaml.load(f, Loader=YAML_LOADER)
 
-        chroma_dir = str(config.chroma.persist_dir)
-        if not chroma_dir.startswith(("~", "/")):
-            config.chroma.persist_dir = str((config_path.parent / chroma_dir).resolve())
-
-        return config
+        return cls.from_dict(data, base_dir=config_path.parent)
 
     def to_dict(self) -> dict[str, Any]:
         """Convert configuration to dictionary.
@@ -221,12 +238,14 @@ class RagConfig:
                 "persist_dir": str(self.chroma.persist_dir),
                 "tenant": self.chroma.tenant,
                 "database": self.chroma.database,
+                "json_docstore": self.chroma.json_docstore,
             },
             "ollama": {
                 "base_url": self.ollama.base_url,
                 "embedding_model": self.ollama.embedding_model,
                 "llm_model": self.ollama.llm_model,
                 "embed_batch_size": self.ollama.embed_batch_size,
+                "embed_num_workers": self.ollama.embed_num_workers,
                 "context_window": self.ollama.context_window,
                 "request_timeout": self.ollama.request_timeout,
             },
@@ -20,6 +20,7 @@ class OllamaConfig:
         embedding_model: Name of the embedding model.
         llm_model: Name of the LLM model.
         embed_batch_size: Batch size for embeddings.
+        embed_num_workers: Embedding batches sent to Ollama concurrently.
         context_window: Context window size for LLM.
         request_timeout: Request timeout in seconds.
     """
@@ -28,6 +29,7 @@ class OllamaConfig:
     embedding_model: str = "nomic-embed-text"
     llm_model: str = "llama3.2"
     embed_batch_size: int = 10
+    embed_num_workers: int = 4
     context_window: int = 4096
     request_timeout: float = 60.0
     num_predict: int = -1  # -1 = unlimited; set to cap response tokens and avoid timeout
@@ -44,15 +46,18 @@ def create_embedding_model(config: OllamaConfig) -> OllamaEmbedding:
         Configured OllamaEmbedding instance.
     """
     logger.info(
-        "Creating Ollama embedding model: %s (batch_size=%d)",
+        "Creating Ollama embedding model: %s (batch_size=%d, workers=%d)",
         config.embedding_model,
         config.embed_batch_size,
+        config.embed_num_workers,
     )
 
     return OllamaEmbedding(
         model_name=config.embedding_model,
         base_url=config.base_url,
         embed_batch_size=config.embed_batch_size,
+        # Caps concurrent batch requests in the async embedding API
+        num_workers=config.embed_num_workers,
     )
 
 
@@ -5,14 +5,22 @@ from __future__ import annotations
 import logging
 from dataclasses import dataclass
 import os
+import pickle
 from pathlib import Path
+from typing import Sequence
 
 import chromadb
 from llama_index.core import StorageContext
+from llama_index.core.schema import BaseNode
+from llama_index.core.storage.docstore.types import DEFAULT_PERSIST_FNAME
 from llama_index.vector_stores.chroma import ChromaVectorStore
 
 logger = logging.getLogger(__name__)
 
+# Binary snapshot of a collection's nodes, written next to docstore.json.
+# Loads far faster than the JSON docstore for BM25.
+DOCSTORE_NODES_FILE = "nodes.pkl"
+
 
 @dataclass
 class ChromaConfig:
@@ -117,6 +125,59 @@ def get_docstore_path(config: "ChromaConfig", collection_name: str) -> Path:
     return base / "docstores" / collection_name
 
 
+def save_docstore_nodes(docstore_path: Path, nodes: Sequence[BaseNode]) -> Path:
+    """Write a collection's nodes as a single pickle for fast BM25 loading.
+
+    Args:
+        docstore_path: Docstore directory (see :func:`get_docstore_path`).
+        nodes: Nodes to persist.
+
+    Returns:
+        Path of the written file.
+    """
+    docstore_path.mkdir(parents=True, exist_ok=True)
+    nodes_file = docstore_path / DOCSTORE_NODES_FILE
+    with open(nodes_file, "wb") as f:
+        pickle.dump(list(nodes), f, protocol=pickle.HIGHEST_PROTOCOL)
+    return nodes_file
+
+
+def load_docstore_nodes(docstore_path: Path) -> list[BaseNode]:
+    """Load a collection's persisted nodes.
+
+    Reads the pickle snapshot when present, otherwise falls back to the
+    JSON ``SimpleDocumentStore`` (collections ingested before the snapshot
+    existed, or with only the JSON docstore). The JSON docstore is also used
+    when the snapshot is older than it, or cannot be unpickled (e.g. after a
+    llama_index or pydantic upgrade).
+
+    Args:
+        docstore_path: Docstore directory (see :func:`get_docstore_path`).
+
+    Returns:
+        List of nodes (empty if the docstore holds none).
+    """
+    nodes_file = docstore_path / DOCSTORE_NODES_FILE
+    json_file = docstore_path / DEFAULT_PERSIST_FNAME
+    try:
+        nodes_mtime = nodes_file.stat().st_mtime_ns
+    except FileNotFoundError:
+        nodes_mtime = None
+
+    if nodes_mtime is not None:
+        if json_file.exists() and json_file.stat().st_mtime_ns > nodes_mtime:
+            logger.warning("%s is older than %s; loading the JSON docstore", nodes_file, json_file.name)
+        else:
+            try:
+                with open(nodes_file, "rb") as f:
+                    return pickle.load(f)
+            except Exception as e:
+                logger.warning("Cannot load %s (%s); loading the JSON docstore", nodes_file, e)
+
+    storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
+    return list(storage.docstore.docs.values())
+
+
 def create_storage_context(
     client: chromadb.ClientAPI,
     collection_name: str,
@@ -0,0 +1,58 @@
+"""Tests for the persisted BM25 docstore helpers.
+
+Usage:
+    uv run pytest elt_llm_core/tests/test_vector_store.py
+"""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+from llama_index.core import StorageContext
+from llama_index.core.schema import TextNode
+from llama_index.core.storage.docstore import SimpleDocumentStore
+
+from elt_llm_core.vector_store import (
+    DOCSTORE_NODES_FILE,
+    load_docstore_nodes,
+    save_docstore_nodes,
+)
+
+
+@pytest.fixture
+def docstore_path(tmp_path):
+    """A docstore directory holding the JSON docstore with two nodes."""
+    docstore = SimpleDocumentStore()
+    docstore.add_documents([TextNode(text="json one", id_="j1"), TextNode(text="json two", id_="j2")])
+    StorageContext.from_defaults(docstore=docstore).persist(persist_dir=str(tmp_path))
+    return tmp_path
+
+
+def _texts(nodes) -> list[str]:
+    return sorted(node.text for node in nodes)
+
+
+def test_loads_pickle_snapshot(docstore_path):
+    """A snapshot written after the JSON docstore is what gets loaded."""
+    save_docstore_nodes(docstore_path, [TextNode(text="pickled", id_="p1")])
+    assert _texts(load_docstore_nodes(docstore_path)) == ["pickled"]
+
+
+def test_falls_back_to_json_when_snapshot_unreadable(docstore_path):
+    """A snapshot that cannot be unpickled is skipped for the JSON docstore."""
+    (docstore_path / DOCSTORE_NODES_FILE).write_bytes(b"not a pickle")
+    assert _texts(load_docstore_nodes(docstore_path)) == ["json one", "json two"]
+
+
+def test_falls_back_to_json_when_snapshot_is_stale(docstore_path):
+    """A snapshot older than docstore.json is ignored."""
+    nodes_file = save_docstore_nodes(docstore_path, [TextNode(text="stale", id_="s1")])
+    json_mtime = (docstore_path / "docstore.json").stat().st_mtime_ns
+    os.utime(nodes_file, ns=(json_mtime - 10**9, json_mtime - 10**9))
+    assert _texts(load_docstore_nodes(docstore_path)) == ["json one", "json two"]
+
+
+def test_loads_json_without_snapshot(docstore_path):
+    """Collections with only the JSON docstore still load."""
+    assert _texts(load_docstore_nodes(docstore_path)) == ["json one", "json two"]
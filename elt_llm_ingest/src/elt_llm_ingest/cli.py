@@ -3,14 +3,20 @@
 from __future__ import annotations
 
 import argparse
+import importlib
 import logging
+import mmap
+import os
+import threading
 from pathlib import Path
+from typing import TYPE_CHECKING, Any
 
 import yaml
 
-from elt_llm_core.config import RagConfig
-from elt_llm_ingest.ingest import IngestConfig, run_ingestion
-from elt_llm_ingest.preprocessor import PreprocessorConfig
+from elt_llm_core.config import YAML_LOADER, RagConfig
+
+if TYPE_CHECKING:
+    from elt_llm_ingest.ingest import IngestConfig
 
 
 def get_config_dir() -> Path:
@@ -18,14 +24,58 @@ def get_config_dir() -> Path:
     return Path(__file__).parent.parent / "config"
 
 
+def _expand(path: str) -> Path:
+    """Build a Path, expanding ``~`` only when the string actually uses it."""
+    return Path(path).expanduser() if path.startswith("~") else Path(path)
+
+
+def _load_ingest_data(config_path: Path) -> Any:
+    """Parse an ingestion config file (``.yaml`` or ``.toml``).
+
+    TOML configs are read with the stdlib ``tomllib``. YAML files are
+    memory-mapped and handed straight to libyaml, so large configs (thousands
+    of ``file_paths``) are read from the page cache without first being copied
+    into a Python bytes object.
+    """
+    if config_path.suffix == ".toml":
+        import tomllib
+
+        with open(config_path, "rb") as f:
+            return tomllib.load(f)
+
+    with open(config_path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return None  # mmap cannot map an empty file
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return yaml.load(mm, Loader=YAML_LOADER)
+
+
+def _preload_ingest() -> None:
+    """Import the ingestion pipeline (llama_index, chromadb) ahead of first use."""
+    try:
+        importlib.import_module("elt_llm_ingest.ingest")
+    except ImportError:
+        pass  # re-raised with its traceback at the real import site
+
+
 def main() -> None:
     """CLI entry point for ingestion."""
+    try:
+        _main()
+    except Exception as e:
+        print(f"Unexpected error: {e}")
+        raise SystemExit(1)
+
+
+def _main() -> None:
+    """Parse arguments, load configs and run ingestion."""
     parser = argparse.ArgumentParser(description="Ingest documents into RAG index")
     parser.add_argument(
         "--config",
         "-c",
         type=str,
-        help="Path to ingestion configuration YAML file (e.g., config/dama_dmbok.yaml)",
+        nargs="+",
+        help="Path(s) to ingestion configuration YAML/TOML file(s) (e.g., config/dama_dmbok.yaml)",
     )
     parser.add_argument(
         "--rag-config",
@@ -50,6 +100,13 @@ def main() -> None:
         action="store_true",
         help="Force re-ingestion regardless of file changes (bypass hash checking)",
     )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Ingest multiple configs in parallel with this many processes (default: 1)",
+    )
     parser.add_argument(
         "--verbose",
         "-v",
@@ -65,80 +122,173 @@ def main() -> None:
 
     args = parser.parse_args()
 
-    # Configure logging
-    log_level = logging.DEBUG if args.verbose else logging.INFO
-    logging.basicConfig(
-        level=log_level,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    )
+    # Configure logging. Thread/process fields are never formatted, so skip
+    # collecting them per record; timestamps and logger names only in verbose mode.
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    if args.verbose:
+        log_level = logging.DEBUG
+        log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    else:
+        log_level = logging.INFO
+        log_format = "%(levelname)s %(message)s"
+    logging.basicConfig(level=log_level, format=log_format)
 
     config_dir = get_config_dir()
 
     # List configs mode
     if args.list:
         print("\nAvailable ingestion configs:\n")
-        for cfg in sorted(config_dir.glob("*.yaml")):
+        for cfg in sorted([*config_dir.glob("*.yaml"), *config_dir.glob("*.toml")]):
             if cfg.name != "rag_config.yaml":
                 print(f"  {cfg.name}")
         print()
         return
 
     # Determine config paths
-    if args.config:
-        config_path = Path(args.config).expanduser()
-    else:
+    if not args.config:
         print("Error: --config is required (or use --list to see available configs)")
         raise SystemExit(1)
 
-    if not config_path.exists():
-        # Try config directory
-        alt_path = config_dir / config_path.name
-        if alt_path.exists():
-            config_path = alt_path
+    # One override for several configs would make them all rebuild (and, with
+    # --workers, write) the same collection
+    if args.collection and len(args.config) > 1:
+        print("Error: --collection can only be used with a single --config")
+        raise SystemExit(1)
+
+    # The ingestion pipeline is by far the slowest import; warm it on a
+    # background thread while configs are read. Started only once an ingest
+    # will run (--list/--help exit above), and joined before any exit below
+    # so the process never ends mid-import.
+    preload = threading.Thread(target=_preload_ingest, daemon=True)
+    preload.start()
+
+    config_paths: list[Path] = []
+    for config_arg in args.config:
+        config_path = _expand(config_arg)
+        if not config_path.exists():
+            # Try config directory
+            alt_path = config_dir / config_path.name
+            if alt_path.exists():
+                config_path = alt_path
+        config_paths.append(config_path)
 
     # Load RAG configuration
-    rag_config_path = args.rag_config
-    if rag_config_path is None:
-        rag_config_path = config_dir / "rag_config.yaml"
-    else:
-        rag_config_path = Path(rag_config_path).expanduser()
+    rag_config_path = _expand(args.rag_config) if args.rag_config else config_dir / "rag_config.yaml"
 
     try:
-        rag_config = RagConfig.from_yaml(rag_config_path)
-    except (FileNotFoundError, ValueError) as e:
+        with open(rag_config_path, "rb") as f:
+            rag_config = RagConfig.from_dict(
+                yaml.load(f, Loader=YAML_LOADER),
+                base_dir=rag_config_path.parent,
+            )
+    except FileNotFoundError:
+        print(f"RAG configuration not found: {rag_config_path}")
+        raise SystemExit(1)
+    except ValueError as e:
         print(f"RAG configuration error: {e}")
         raise SystemExit(1)
+    finally:
+        preload.join()
 
-    # Load ingestion configuration
-    with open(config_path) as f:
-        ingest_data = yaml.safe_load(f)
-
-    # Create preprocessor config if present
-    preprocessor_config = None
-    if "preprocessor" in ingest_data:
-        preprocessor_config = PreprocessorConfig.from_dict(ingest_data["preprocessor"])
-
-    # Create ingestion config
-    ingest_config = IngestConfig(
-        collection_name=args.collection or ingest_data["collection_name"],
-        file_paths=ingest_data.get("file_paths", []),
-        metadata=ingest_data.get("metadata"),
-        rebuild=not args.no_rebuild,
-        force=args.force,
-        preprocessor=preprocessor_config,
-    )
+    from elt_llm_ingest.ingest import IngestConfig
 
-    try:
-        index, node_count = run_ingestion(ingest_config, rag_config)
-        if node_count > 0:
-            print(f"\nIngestion complete: {node_count} chunks indexed")
-        else:
-            print(f"\nNo changes detected - collection unchanged")
-    except ValueError as e:
-        print(f"Error: {e}")
-        raise SystemExit(1)
-    except Exception as e:
-        print(f"Unexpected error: {e}")
+    # Load and validate every ingestion configuration before running any of them
+    ingest_configs: list[IngestConfig] = []
+    for config_path in config_paths:
+        ingest_data = _load_ingest_data(config_path)
+        try:
+            ingest_configs.append(
+                IngestConfig.from_dict(
+                    ingest_data,
+                    collection_name=args.collection,
+                    rebuild=not args.no_rebuild,
+                    force=args.force,
+                )
+            )
+        except ValueError as e:
+            print(f"Ingestion configuration error ({config_path}): {e}")
+            raise SystemExit(1)
+
+    if args.workers > 1 and len(ingest_configs) > 1:
+        targets = [c.collection_name or c.collection_prefix for c in ingest_configs]
+        if len(set(targets)) < len(targets):
+            print("Error: configs run with --workers must target different collections")
+            raise SystemExit(1)
+        _run_parallel(config_paths, ingest_configs, rag_config, args.workers)
+        return
+
+    multiple = len(ingest_configs) > 1
+    for config_path, ingest_config in zip(config_paths, ingest_configs):
+        try:
+            node_count = _run_config(ingest_config, rag_config)
+        except ValueError as e:
+            print(f"Error: {e}")
+            raise SystemExit(1)
+        _print_result(node_count, config_path.name if multiple else "")
+
+
+def _run_config(ingest_config: IngestConfig, rag_config: RagConfig) -> int:
+    """Run one ingestion and return the number of chunks indexed.
+
+    Module-level (and returning only the count, not the index) so it can be
+    shipped to a worker process.
+    """
+    from elt_llm_ingest.ingest import run_ingestion
+
+    _, node_count = run_ingestion(ingest_config, rag_config)
+    return node_count
+
+
+def _print_result(node_count: int, label: str = "") -> None:
+    """Print the outcome of a single ingestion run."""
+    prefix = f"[{label}] " if label else ""
+    if node_count > 0:
+        print(f"\n{prefix}Ingestion complete: {node_count} chunks indexed")
+    else:
+        print(f"\n{prefix}No changes detected - collection unchanged")
+
+
+def _run_parallel(
+    config_paths: list[Path],
+    ingest_configs: list[IngestConfig],
+    rag_config: RagConfig,
+    workers: int,
+) -> None:
+    """Ingest independent configs concurrently in a process pool.
+
+    Each config targets its own collection (checked by the caller, and
+    ``--collection`` is rejected for several configs). Runs still share the
+    Chroma persist directory, including the ``file_hashes`` collection that
+    every worker reads and writes (its records are keyed by target
+    collection), and the Ollama server.
+    """
+    from concurrent.futures import as_completed
+
+    from elt_llm_core.vector_store import create_chroma_client
+    from elt_llm_ingest.ingest import _process_pool
+
+    # Open the persist directory once here, so a fresh one is created and
+    # migrated before the workers start instead of by all of them at once
+    create_chroma_client(rag_config.chroma)
+
+    failed = 0
+    with _process_pool(min(workers, len(ingest_configs))) as ex:
+        futures = {
+            ex.submit(_run_config, ingest_config, rag_config): config_path.name
+            for config_path, ingest_config in zip(config_paths, ingest_configs)
+        }
+        for future in as_completed(futures):
+            label = futures[future]
+            try:
+                _print_result(future.result(), label)
+            except Exception as e:
+                print(f"\n[{label}] Error: {e}")
+                failed += 1
+
+    if failed:
+        print(f"\n{failed}/{len(ingest_configs)} ingestion(s) failed")
         raise SystemExit(1)
 
 
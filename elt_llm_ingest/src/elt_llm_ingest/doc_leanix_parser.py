@@ -12,14 +12,145 @@ Usage:
 import xml.etree.ElementTree as ET
 import json
 import argparse
+import functools
+import html
+import io
+import mmap
+import os
 import re
+import sys
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple, Union
+from dataclasses import dataclass, field, fields
 from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+try:
+    from lxml import etree as _etree  # optional: libxml2 parser when installed
+except ImportError:
+    _etree = ET
+try:
+    import orjson  # optional: faster JSON output when installed
+except ImportError:
+    orjson = None
+
+# stdlib elements expose attributes as a plain dict; lxml uses a live proxy
+_ATTRIB_IS_DICT = _etree is ET
+
+# Formats LeanIXExtractor.save() writes
+_SAVE_FORMATS = frozenset({"json", "markdown", "md", "both", "csv"})
+
+# Compiled once; clean_label runs for every asset and group label.
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
+# Edge style tokens, one compiled pattern per concern
+_EDGE_STYLE_RE = re.compile(r'edgeStyle=(\w+)')
+_ARROW_RE = re.compile(r'(start|end)Arrow=(\w+)')
+_EDGE_STYLE_MAP = {
+    'entityRelationEdgeStyle': "Entity Relationship",
+    'orthogonalEdgeStyle': "Orthogonal",
+    'elbowEdgeStyle': "Elbow",
+}
+_ARROW_MAP = {
+    'ERzeroToMany': "0..*",
+    'ERoneToMany': "1..*",
+    'ERoneToOne': "1..1",
+    'ERzeroToOne': "0..1",
+}
+# (start, end) arrow cardinalities → the "start-end" notation stored on the
+# relationship. Built once so every edge shares the same string objects.
+_CARDINALITY_KEYS = {
+    (start, end): f"{start or ''}-{end or ''}"
+    for start in (None, *_ARROW_MAP.values())
+    for end in (None, *_ARROW_MAP.values())
+    if start or end
+}
+_CARDINALITY_PHRASES = {
+    "0..*-0..*": "relates to (zero or more to zero or more)",
+    "1..*-0..*": "relates to (one or more to zero or more)",
+    "0..*-1..*": "relates to (zero or more to one or more)",
+    "1..1-0..*": "relates to (exactly one to zero or more)",
+    "0..*-1..1": "relates to (zero or more to exactly one)",
+    "1..1-1..1": "relates to (exactly one to exactly one)",
+}
+
+
+# Keyword buckets for entities outside any domain group. Matching is by
+# substring (so 'unit' also catches 'Community'), first bucket wins.
+_PARTY_KEYWORDS = (
+    'player', 'club', 'team', 'individual', 'organisation', 'employee',
+    'customer', 'member', 'official', 'learner', 'prospect', 'supplier',
+    'county', 'charity', 'government', 'school', 'authority', 'candidate',
+    'mentor', 'developer', 'household', 'unit', 'supporter', 'attendee',
+)
+_CHANNEL_KEYWORDS = (
+    'channel', 'broadcast', 'streaming', 'tv', 'radio', 'sms', 'email',
+    'mobile', 'web', 'portal', 'social', 'push', 'live', 'chat',
+    'call centre', 'concierge', 'in person', 'pos', 'turnstile', 'merchandise',
+)
+_PARTY_RE = re.compile('|'.join(map(re.escape, _PARTY_KEYWORDS)))
+_CHANNEL_RE = re.compile('|'.join(map(re.escape, _CHANNEL_KEYWORDS)))
+_ACCOUNT_RE = re.compile('account')
+_ASSET_RE = re.compile('asset|data|property')
+
+
+def _to_plain(obj, names: Tuple[str, ...]) -> Dict:
+    """Shallow field dict of a LeanIX dataclass instance.
+
+    The LeanIX dataclasses hold only scalars and flat dicts of strings, so
+    reading the named fields directly gives the same result as ``asdict()``
+    without its recursive deep copy.
+    """
+    return {name: getattr(obj, name) for name in names}
 
 
-@dataclass
+def _opt_float(value: Optional[str]) -> Optional[float]:
+    """Parse a geometry attribute, treating missing/empty as None."""
+    return float(value) if value else None
+
+
+def _write_fragments(file_path: Path, fragments: Iterator[str]) -> None:
+    """Stream Markdown fragments into a UTF-8 file."""
+    with open(file_path, "w", encoding="utf-8") as f:
+        f.writelines(fragments)
+
+
+# Exports reuse a handful of distinct edge styles across thousands of edges,
+# so the style parsers are memoised on the style string.
+@functools.lru_cache(maxsize=1024)
+def _relationship_type(style: str) -> Optional[str]:
+    """Relationship type named by the edgeStyle token, if any."""
+    m = _EDGE_STYLE_RE.search(style)
+    return _EDGE_STYLE_MAP.get(m.group(1)) if m else None
+
+
+@functools.lru_cache(maxsize=1024)
+def _cardinality(style: str) -> Optional[str]:
+    """Cardinality notation ("start-end") from the ER arrow tokens, if any."""
+    start = end = None
+    for side, value in _ARROW_RE.findall(style):
+        if side == 'start':
+            start = _ARROW_MAP.get(value)
+        else:
+            end = _ARROW_MAP.get(value)
+    return _CARDINALITY_KEYS.get((start, end))
+
+
+def _classify_uncategorized(label: str) -> str:
+    """Bucket an uncategorized entity label: party, channel, account, asset or other."""
+    label = label.lower()
+    if _PARTY_RE.search(label):
+        return "party"
+    if _CHANNEL_RE.search(label):
+        return "channel"
+    if _ACCOUNT_RE.search(label):
+        return "account"
+    if _ASSET_RE.search(label):
+        return "asset"
+    return "other"
+
+
+@dataclass(slots=True)
 class LeanIXAsset:
     """Represents a LeanIX fact sheet/asset"""
     id: str
@@ -35,9 +166,11 @@ class LeanIXAsset:
     height: Optional[float] = None
     style: Optional[str] = None
     raw_attributes: Dict = None
+    # label.upper(), computed once for the root/member comparisons; not serialised
+    label_upper: str = field(default="", repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class LeanIXRelationship:
     """Represents a relationship between LeanIX assets"""
     id: str
@@ -50,6 +183,31 @@ class LeanIXRelationship:
     style: Optional[str] = None
 
 
+# Serialised field names, resolved once (label_upper is derived, not output)
+_ASSET_FIELDS = tuple(f.name for f in fields(LeanIXAsset) if f.name != "label_upper")
+_RELATIONSHIP_FIELDS = tuple(f.name for f in fields(LeanIXRelationship))
+
+
+class _UncategorizedBuckets(NamedTuple):
+    """Uncategorized entity labels by keyword bucket (see _classify_uncategorized)."""
+    party: List[str]
+    channel: List[str]
+    account: List[str]
+    asset: List[str]
+    other: List[str]
+
+
+@dataclass
+class _RenderModel:
+    """Domain grouping shared by the Markdown renderers."""
+    domain_names: List[str]                                # sorted, excludes Uncategorized
+    assets_by_group: Dict[str, List[LeanIXAsset]]          # domain → assets sorted by label
+    uncategorized: _UncategorizedBuckets                   # each bucket sorted
+    members_by_group: Dict[str, List[str]]                 # domain → sorted non-root labels
+    rels_by_source: Dict[str, List[LeanIXRelationship]]    # sorted sources → rels sorted by target
+    rels_by_domain: Dict[str, List[LeanIXRelationship]]    # domain label → touching rels sorted by target
+
+
 class LeanIXExtractor:
     """Extract assets and relationships from LeanIX draw.io XML"""
 
@@ -62,39 +220,89 @@ class LeanIXExtractor:
         self.xml_file = Path(xml_file)
         self.model_name = model_name
         self.org_name = org_name
-        self.tree = None
-        self.root = None
         self.assets: Dict[str, LeanIXAsset] = {}
         self.relationships: List[LeanIXRelationship] = []
         self.groups: Dict[str, str] = {}  # group_id -> group_label
         self._group_parents: Dict[str, str] = {}  # group_id -> parent_id
-        self.parent_map = {}  # child -> parent mapping for efficient lookups
+        self._objects: List[ET.Element] = []  # <object> cells, document order
+        self._group_cells: List[ET.Element] = []  # group-styled vertex <mxCell>s, document order
+        self._edge_cells: List[ET.Element] = []   # edge <mxCell>s, document order
+        self._label_objects: Dict[str, ET.Element] = {}  # parent_id → first labelled factSheet child
         self._group_fact_sheet_ids: Dict[str, str] = {}  # group_id → fact_sheet_id of its label node
         self._domain_ids: Dict[str, str] = {}             # domain_label → fact_sheet_id
         self._subtype_ids: Dict[Tuple[str, str], str] = {}  # (domain_label, subtype_label) → fact_sheet_id
 
     def parse_xml(self):
-        """Parse the XML file"""
+        """Parse the XML file.
+
+        Streams the document with ``iterparse`` (lxml's when it is installed,
+        otherwise the stdlib one) instead of building the full DOM.  Only the
+        cells the extractors need are kept — every ``<object>`` and the
+        group-styled / edge ``<mxCell>`` elements — and each top-level diagram
+        cell is detached from ``<root>`` as soon as it has been read, so the
+        rest of the tree (plain shapes, text cells) is freed while parsing.
+        The first labelled factSheet under each parent cell is indexed on the
+        way, for extract_groups() to label group containers.
+
+        lxml reads the file itself in C.  With the stdlib parser the file is
+        memory-mapped and Expat reads from the mapping directly, skipping the
+        buffered-reader copy.
+        """
         print(f"Parsing {self.xml_file}...")
+        self._objects = []
+        self._group_cells = []
+        self._edge_cells = []
+        self._label_objects = {}
+        events = ("start", "end")
         try:
-            self.tree = ET.parse(self.xml_file)
-            self.root = self.tree.getroot()
-            # Build parent map for efficient parent lookups
-            self.parent_map = {child: parent for parent in self.root.iter() for child in parent}
-        except ET.ParseError as e:
+            if _etree is not ET:
+                self._collect_cells(_etree.iterparse(str(self.xml_file), events=events))
+            else:
+                with open(self.xml_file, "rb") as f:
+                    if os.fstat(f.fileno()).st_size == 0:
+                        # mmap cannot map an empty file; let the parser report it
+                        self._collect_cells(_etree.iterparse(f, events=events))
+                    else:
+                        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            self._collect_cells(_etree.iterparse(mm, events=events))
+        except (ET.ParseError, _etree.ParseError) as e:
             print(f"❌ Error parsing XML: {e}")
             raise
         except FileNotFoundError:
             print(f"❌ File not found: {self.xml_file}")
             raise
-        
+
+    def _collect_cells(self, events: Iterator[Tuple[str, ET.Element]]) -> None:
+        """Bucket streamed cells for the extractors (see parse_xml)."""
+        stack: List[ET.Element] = []
+        for event, elem in events:
+            if event == "start":
+                stack.append(elem)
+                continue
+            stack.pop()
+            if elem.tag == "object":
+                self._objects.append(elem)
+                if elem.get('type') == 'factSheet' and elem.get('label'):
+                    cell = elem.find('mxCell')
+                    if cell is not None:
+                        self._label_objects.setdefault(cell.get('parent'), elem)
+            elif elem.tag == "mxCell":
+                # Bucket by role here so each extractor walks only its own cells
+                if elem.get('edge') == '1':
+                    self._edge_cells.append(elem)
+                if 'group' in elem.get('style', '') and elem.get('vertex') == '1':
+                    self._group_cells.append(elem)
+            # Every top-level cell leaves <root> once read: the kept ones live
+            # on in the buckets above, the rest are freed
+            if stack and stack[-1].tag == "root":
+                stack[-1].remove(elem)
+
     def extract_all(self):
         """Extract all assets and relationships"""
         self.extract_groups()
         self.extract_assets()
         self._detect_type3_domains()
         self.extract_relationships()
-        self.enrich_relationships()
         self._assign_subgroups()
         self._build_container_ids()
         
@@ -116,15 +324,13 @@ class LeanIXExtractor:
         group_parents: Dict[str, str] = {}
 
         # Type 1: bare mxCell with group style
-        for mxcell in self.root.iter('mxCell'):
-            style = mxcell.get('style', '')
-            if 'group' in style and mxcell.get('vertex') == '1':
-                gid = mxcell.get('id')
-                if gid:
-                    group_parents[gid] = mxcell.get('parent', '1')
+        for mxcell in self._group_cells:
+            gid = mxcell.get('id')
+            if gid:
+                group_parents[gid] = mxcell.get('parent', '1')
 
         # Type 2: object-wrapped mxCell with group style (e.g. PARTY container id=409)
-        for obj in self.root.iter('object'):
+        for obj in self._objects:
             cell = obj.find('mxCell')
             if cell is not None:
                 style = cell.get('style', '')
@@ -136,14 +342,11 @@ class LeanIXExtractor:
         # Label each group from its first factSheet child; capture fact_sheet_id
         _group_fact_sheet_ids: Dict[str, str] = {}
         for group_id in group_parents:
-            for obj in self.root.iter('object'):
-                obj_cell = obj.find('mxCell')
-                if obj_cell is not None and obj_cell.get('parent') == group_id:
-                    label = obj.get('label', '')
-                    if label and obj.get('type') == 'factSheet':
-                        self.groups[group_id] = self.clean_label(label)
-                        _group_fact_sheet_ids[group_id] = obj.get('factSheetId', '') or ''
-                        break
+            obj = self._label_objects.get(group_id)
+            if obj is not None:
+                # Interned: every member asset's parent_group points at this string
+                self.groups[group_id] = sys.intern(self.clean_label(obj.get('label')))
+                _group_fact_sheet_ids[group_id] = obj.get('factSheetId', '') or ''
 
         self._group_fact_sheet_ids = _group_fact_sheet_ids
         # Store parent chain for use by _assign_subgroups() in Enhancement 1b
@@ -151,7 +354,7 @@ class LeanIXExtractor:
     
     def extract_assets(self):
         """Extract all fact sheet assets"""
-        for obj in self.root.iter('object'):
+        for obj in self._objects:
             if obj.get('type') == 'factSheet':
                 # Skip object-wrapped group containers (Type 2 groups detected in
                 # extract_groups). They are structural containers, not leaf entities.
@@ -166,25 +369,29 @@ class LeanIXExtractor:
         
     def parse_asset(self, obj: ET.Element) -> Optional[LeanIXAsset]:
         """Parse a single asset from object element"""
-        obj_id = obj.get('id')
+        # Bound attribute getters, looked up once per element
+        obj_get = obj.attrib.get
+        obj_id = obj_get('id')
         if not obj_id:
             return None
             
         mxcell = obj.find('mxCell')
         if mxcell is None:
             return None
+        cell_get = mxcell.attrib.get
             
         # Extract geometry
         geometry = mxcell.find('mxGeometry')
         x = y = width = height = None
         if geometry is not None:
-            x = float(geometry.get('x', 0)) if geometry.get('x') else None
-            y = float(geometry.get('y', 0)) if geometry.get('y') else None
-            width = float(geometry.get('width', 0)) if geometry.get('width') else None
-            height = float(geometry.get('height', 0)) if geometry.get('height') else None
+            geo_get = geometry.attrib.get
+            x = _opt_float(geo_get('x'))
+            y = _opt_float(geo_get('y'))
+            width = _opt_float(geo_get('width'))
+            height = _opt_float(geo_get('height'))
             
         # Determine parent group
-        parent_id = mxcell.get('parent')
+        parent_id = cell_get('parent')
         parent_group = self.groups.get(parent_id)
 
         # Handle nested groups: if parent is a group that is itself nested inside
@@ -199,14 +406,16 @@ class LeanIXExtractor:
                 pre_subgroup = self.groups.get(parent_id)
 
         # Clean label (remove HTML tags and decode entities)
-        raw_label = obj.get('label', '')
+        raw_label = obj_get('label', '')
         label = self.clean_label(raw_label)
 
         return LeanIXAsset(
             id=obj_id,
             label=label,
-            fact_sheet_type=obj.get('factSheetType', 'Unknown'),
-            fact_sheet_id=obj.get('factSheetId', ''),
+            label_upper=label.upper(),
+            # Few distinct types across many assets: share one string object each
+            fact_sheet_type=sys.intern(obj_get('factSheetType', 'Unknown')),
+            fact_sheet_id=obj_get('factSheetId', ''),
             parent_group=parent_group,
             parent_id=parent_id,
             subgroup=pre_subgroup,
@@ -214,110 +423,78 @@ class LeanIXExtractor:
             y=y,
             width=width,
             height=height,
-            style=mxcell.get('style', ''),
-            raw_attributes=dict(obj.attrib)
+            style=cell_get('style', ''),
+            # The element's own attribute dict, not a copy: the <object> is
+            # kept in self._objects anyway and nothing mutates either side.
+            raw_attributes=obj.attrib if _ATTRIB_IS_DICT else dict(obj.attrib)
         )
     
     def extract_relationships(self):
-        """Extract all relationships (edges) between assets"""
-        for mxcell in self.root.iter('mxCell'):
-            if mxcell.get('edge') == '1':
-                relationship = self.parse_relationship(mxcell)
-                if relationship:
-                    self.relationships.append(relationship)
+        """Extract all relationships (edges) between assets.
+
+        Runs after every asset is known, so endpoint labels are filled in as
+        each relationship is built rather than in a separate pass.
+        """
+        for mxcell in self._edge_cells:
+            relationship = self.parse_relationship(mxcell)
+            if relationship:
+                self.relationships.append(relationship)
                     
         print(f"Extracted {len(self.relationships)} relationships")
         
     def parse_relationship(self, mxcell: ET.Element) -> Optional[LeanIXRelationship]:
         """Parse a single relationship from mxCell element"""
-        source_id = mxcell.get('source')
-        target_id = mxcell.get('target')
+        cell_get = mxcell.attrib.get
+        source_id = cell_get('source')
+        target_id = cell_get('target')
         
         if not source_id or not target_id:
             return None
             
         # Only create relationship if both source and target are known assets
-        if source_id not in self.assets or target_id not in self.assets:
+        source = self.assets.get(source_id)
+        target = self.assets.get(target_id)
+        if source is None or target is None:
             return None
             
-        style = mxcell.get('style', '')
+        style = cell_get('style', '')
         
         # Extract relationship type and cardinality from style
-        relationship_type = self.extract_relationship_type(style)
-        cardinality = self.extract_cardinality(style)
+        relationship_type = _relationship_type(style)
+        cardinality = _cardinality(style)
         
         return LeanIXRelationship(
-            id=mxcell.get('id', ''),
+            id=cell_get('id', ''),
             source_id=source_id,
             target_id=target_id,
+            source_label=source.label,
+            target_label=target.label,
             relationship_type=relationship_type,
             cardinality=cardinality,
             style=style
         )
     
-    def enrich_relationships(self):
-        """Add labels to relationships"""
-        for rel in self.relationships:
-            if rel.source_id in self.assets:
-                rel.source_label = self.assets[rel.source_id].label
-            if rel.target_id in self.assets:
-                rel.target_label = self.assets[rel.target_id].label
-    
     def clean_label(self, label: str) -> str:
         """Clean HTML tags and decode entities from label"""
         if not label:
             return ""
-        # Remove HTML tags
-        label = re.sub(r'<[^>]+>', '', label)
-        # Decode common HTML entities
-        label = label.replace('&amp;', '&')
-        label = label.replace('&lt;', '<')
-        label = label.replace('&gt;', '>')
-        label = label.replace('&nbsp;', ' ')
-        label = label.replace('&#10;', '\n')
-        # Clean up whitespace
-        label = ' '.join(label.split())
-        return label.strip()
+        # Most labels are plain text: only run the tag/entity passes when needed
+        if '<' in label:
+            # Remove HTML tags
+            label = _HTML_TAG_RE.sub('', label)
+        if '&' in label:
+            # Decode HTML entities (&amp;, &nbsp;, &#10;, ...) in one pass
+            label = html.unescape(label)
+        # Clean up whitespace (split/join also trims both ends)
+        return ' '.join(label.split())
     
     def extract_relationship_type(self, style: str) -> Optional[str]:
         """Extract relationship type from style attribute"""
-        if 'edgeStyle=entityRelationEdgeStyle' in style:
-            return "Entity Relationship"
-        elif 'edgeStyle=orthogonalEdgeStyle' in style:
-            return "Orthogonal"
-        elif 'edgeStyle=elbowEdgeStyle' in style:
-            return "Elbow"
-        return None
+        return _relationship_type(style)
     
     def extract_cardinality(self, style: str) -> Optional[str]:
         """Extract cardinality from endArrow/startArrow attributes"""
-        cardinality_parts = []
-        
-        # Check start arrow
-        if 'startArrow=ERzeroToMany' in style:
-            cardinality_parts.append("0..*")
-        elif 'startArrow=ERoneToMany' in style:
-            cardinality_parts.append("1..*")
-        elif 'startArrow=ERoneToOne' in style:
-            cardinality_parts.append("1..1")
-        elif 'startArrow=ERzeroToOne' in style:
-            cardinality_parts.append("0..1")
-            
-        cardinality_parts.append("-")
-        
-        # Check end arrow
-        if 'endArrow=ERzeroToMany' in style:
-            cardinality_parts.append("0..*")
-        elif 'endArrow=ERoneToMany' in style:
-            cardinality_parts.append("1..*")
-        elif 'endArrow=ERoneToOne' in style:
-            cardinality_parts.append("1..1")
-        elif 'endArrow=ERzeroToOne' in style:
-            cardinality_parts.append("0..1")
-            
-        if len(cardinality_parts) > 1:
-            return "".join(cardinality_parts)
-        return None
+        return _cardinality(style)
     
     def to_dict(self) -> Dict:
         """Convert extracted data to dictionary"""
@@ -326,16 +503,41 @@ class LeanIXExtractor:
                 "source_file": str(self.xml_file),
                 "total_assets": len(self.assets),
                 "total_relationships": len(self.relationships),
-                "asset_types": list(set(a.fact_sheet_type for a in self.assets.values()))
+                "asset_types": list(self.assets_by_type)
             },
-            "assets": [asdict(asset) for asset in self.assets.values()],
-            "relationships": [asdict(rel) for rel in self.relationships]
+            "assets": [_to_plain(asset, _ASSET_FIELDS) for asset in self.assets.values()],
+            "relationships": [_to_plain(rel, _RELATIONSHIP_FIELDS) for rel in self.relationships]
         }
     
     def to_json(self, indent: int = 2) -> str:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), indent=indent, default=str)
 
+    def to_json_bytes(self) -> bytes:
+        """Convert to UTF-8 encoded JSON (2-space indent) for writing to disk.
+
+        Uses orjson when it is installed, which serialises natively and emits
+        bytes directly; otherwise falls back to to_json(). Both parse to the
+        same document, though orjson writes non-ASCII text unescaped.
+        """
+        if orjson is not None:
+            return orjson.dumps(self.to_dict(), option=orjson.OPT_INDENT_2, default=str)
+        return self.to_json().encode("utf-8")
+
+    def write_json(self, json_file: Union[str, Path]) -> None:
+        """Write the JSON document (2-space indent) to ``json_file``.
+
+        orjson's bytes are written as-is when it is installed; otherwise the
+        stdlib encoder streams into the file rather than building the whole
+        document as one string first.
+        """
+        if orjson is not None:
+            with open(json_file, 'wb') as f:
+                f.write(self.to_json_bytes())
+        else:
+            with open(json_file, 'w', encoding='utf-8') as f:
+                json.dump(self.to_dict(), f, indent=2, default=str)
+
     # ------------------------------------------------------------------
     # Structured output (JSON + Markdown)
     # ------------------------------------------------------------------
@@ -358,11 +560,12 @@ class LeanIXExtractor:
 
         for domain in sorted(by_group.keys()):
             group_assets = by_group[domain]
+            domain_upper = domain.upper()
             # Subgroup container labels: any label that appears as another asset's subgroup
             used_subgroups = {a.subgroup for a in group_assets if a.subgroup}
             leaf_entities = [
                 a for a in group_assets
-                if a.label.upper() != (domain.upper() if domain else "")
+                if a.label_upper != domain_upper
                 and a.label not in used_subgroups
             ]
             for asset in sorted(leaf_entities, key=lambda a: (a.subgroup or "", a.label)):
@@ -462,34 +665,37 @@ class LeanIXExtractor:
         per entity — no character-count splitting needed.  Every chunk is
         self-contained: it carries domain, subtype, entity name, and LeanIX ID.
         """
-        md: List[str] = [f"# {self.model_name} — Entity Catalogue\n\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# {self.model_name} — Entity Catalogue\n\n")
         for row in self.to_entities_rows():
-            md.append(f"## {row['entity_name']}\n\n")
-            md.append(f"- **Domain:** {row['domain']}\n")
+            w(f"## {row['entity_name']}\n\n- **Domain:** {row['domain']}\n")
             if row["subtype"]:
-                md.append(f"- **Subtype:** {row['subtype']}\n")
+                w(f"- **Subtype:** {row['subtype']}\n")
             if row["fact_sheet_id"]:
-                md.append(f"- **LeanIX ID:** `{row['fact_sheet_id']}`\n")
+                w(f"- **LeanIX ID:** `{row['fact_sheet_id']}`\n")
             if row["fact_sheet_type"]:
-                md.append(f"- **Type:** {row['fact_sheet_type']}\n")
-            md.append("\n")
-        return "".join(md)
+                w(f"- **Type:** {row['fact_sheet_type']}\n")
+            w("\n")
+        return buf.getvalue()
 
     def to_flat_relationships_markdown(self) -> str:
         """Per-relationship Markdown for RAG ingestion."""
-        md: List[str] = [f"# {self.model_name} — Relationships\n\n"]
+        buf = io.StringIO()
+        w = buf.write
+        w(f"# {self.model_name} — Relationships\n\n")
         for row in self.to_relationships_rows():
-            md.append(f"## {row['source_entity']} → {row['target_entity']}\n\n")
+            w(f"## {row['source_entity']} → {row['target_entity']}\n\n")
             if row["source_domain"]:
-                md.append(f"- **Source domain:** {row['source_domain']}\n")
+                w(f"- **Source domain:** {row['source_domain']}\n")
             if row["target_domain"]:
-                md.append(f"- **Target domain:** {row['target_domain']}\n")
+                w(f"- **Target domain:** {row['target_domain']}\n")
             if row["cardinality"]:
-                md.append(f"- **Cardinality:** {row['cardinality']}\n")
+                w(f"- **Cardinality:** {row['cardinality']}\n")
             if row["relationship_type"]:
-                md.append(f"- **Type:** {row['relationship_type']}\n")
-            md.append("\n")
-        return "".join(md)
+                w(f"- **Type:** {row['relationship_type']}\n")
+            w("\n")
+        return buf.getvalue()
 
     def to_markdown(self) -> str:
         """Convert to sentence-format Markdown optimised for RAG ingestion.
@@ -499,21 +705,14 @@ class LeanIXExtractor:
         each section is self-contained so any chunk retrieved by the RAG system
         carries full domain context.
         """
-        md = []
-
-        # Build domain → member list mapping
-        assets_by_group: Dict[str, List[LeanIXAsset]] = defaultdict(list)
-        for asset in self.assets.values():
-            group = asset.parent_group or "Uncategorized"
-            assets_by_group[group].append(asset)
-
-        # Separate Uncategorized for special handling
-        uncategorized_assets = assets_by_group.pop("Uncategorized", [])
-        domain_names = sorted(assets_by_group.keys())
+        buf = io.StringIO()
+        w = buf.write
+        model = self.render_model
+        domain_names = model.domain_names
 
         # ── Overview ──────────────────────────────────────────────────────────
-        md.append(f"# {self.model_name}\n\n")
-        md.append(
+        w(
+            f"# {self.model_name}\n\n"
             f"The {self.model_name} (source: {self.xml_file.name}) "
             f"contains {len(self.assets)} DataObject entities organised into "
             f"{len(domain_names)} domain groups: {', '.join(domain_names)}. "
@@ -525,78 +724,52 @@ class LeanIXExtractor:
 
         # ── One section per domain ────────────────────────────────────────────
         for group_name in domain_names:
-            group_assets = sorted(assets_by_group[group_name], key=lambda a: a.label)
+            group_assets = model.assets_by_group[group_name]
             # Exclude the root node (same name as group) from the member list
-            members = [a.label for a in group_assets if a.label.upper() != group_name.upper()]
-
-            md.append(f"## {group_name} Domain\n\n")
+            members = model.members_by_group.get(group_name, [])
 
             member_str = ", ".join(members) if members else "no sub-entities defined"
-            md.append(
+            w(
+                f"## {group_name} Domain\n\n"
                 f"The {group_name} domain contains {len(group_assets)} entities in the "
                 f"{self.model_name}. "
                 f"The entities within this domain are: {member_str}.\n\n"
             )
 
         # ── Uncategorized entities (Party types, Channels, Accounts, Assets) ──
-        if uncategorized_assets:
-            # Group uncategorized by common patterns
-            party_types = []
-            channel_types = []
-            account_types = []
-            asset_types = []
-            other = []
-
-            for asset in uncategorized_assets:
-                label = asset.label.lower()
-                if any(p in label for p in ['player', 'club', 'team', 'individual', 'organisation', 'employee', 'customer', 'member', 'official', 'learner', 'prospect', 'supplier', 'county', 'charity', 'government', 'school', 'authority', 'candidate', 'mentor', 'developer', 'household', 'unit', 'supporter', 'attendee']):
-                    party_types.append(asset.label)
-                elif any(c in label for c in ['channel', 'broadcast', 'streaming', 'tv', 'radio', 'sms', 'email', 'mobile', 'web', 'portal', 'social', 'push', 'live', 'chat', 'call centre', 'concierge', 'in person', 'pos', 'turnstile', 'merchandise']):
-                    channel_types.append(asset.label)
-                elif 'account' in label:
-                    account_types.append(asset.label)
-                elif 'asset' in label or 'data' in label or 'property' in label:
-                    asset_types.append(asset.label)
-                else:
-                    other.append(asset.label)
+        if any(model.uncategorized):
+            party_types, channel_types, account_types, asset_types, other = model.uncategorized
 
-            md.append("## Additional Model Entities\n\n")
-            md.append(
+            w(
+                "## Additional Model Entities\n\n"
                 f"The following entities are defined in the {self.model_name} "
                 "and include key party, channel, account, and asset entities.\n\n"
             )
 
             if party_types:
-                md.append(f"**Party Types ({len(party_types)} entities):** {', '.join(sorted(party_types))}.\n\n")
+                w(f"**Party Types ({len(party_types)} entities):** {', '.join(party_types)}.\n\n")
             if channel_types:
-                md.append(f"**Channel Types ({len(channel_types)} entities):** {', '.join(sorted(channel_types))}.\n\n")
+                w(f"**Channel Types ({len(channel_types)} entities):** {', '.join(channel_types)}.\n\n")
             if account_types:
-                md.append(f"**Account Types ({len(account_types)} entities):** {', '.join(sorted(account_types))}.\n\n")
+                w(f"**Account Types ({len(account_types)} entities):** {', '.join(account_types)}.\n\n")
             if asset_types:
-                md.append(f"**Asset Types ({len(asset_types)} entities):** {', '.join(sorted(asset_types))}.\n\n")
+                w(f"**Asset Types ({len(asset_types)} entities):** {', '.join(asset_types)}.\n\n")
             if other:
-                md.append(f"**Other Entities ({len(other)} entities):** {', '.join(sorted(other))}.\n\n")
+                w(f"**Other Entities ({len(other)} entities):** {', '.join(other)}.\n\n")
 
         # ── Relationships as natural language ─────────────────────────────────
         if self.relationships:
-            md.append("## Entity Relationships\n\n")
-            md.append(
+            w(
+                "## Entity Relationships\n\n"
                 f"The following relationships define how the domain groups in the "
                 f"{self.model_name} connect to one another.\n\n"
             )
 
-            rels_by_source: Dict[str, List[LeanIXRelationship]] = defaultdict(list)
-            for rel in self.relationships:
-                rels_by_source[rel.source_label or rel.source_id].append(rel)
-
-            for source_label in sorted(rels_by_source.keys()):
-                rels = rels_by_source[source_label]
+            members_by_group = model.members_by_group
 
+            for source_label, rels in model.rels_by_source.items():
                 # List up to 8 representative members of the source domain
-                source_members = sorted(
-                    a.label for a in self.assets.values()
-                    if a.parent_group == source_label and a.label.upper() != source_label.upper()
-                )
+                source_members = members_by_group.get(source_label, [])
                 source_sample = source_members[:8]
                 source_ctx = (
                     f" (including {', '.join(source_sample)}"
@@ -604,15 +777,12 @@ class LeanIXExtractor:
                     if source_sample else ""
                 )
 
-                for rel in sorted(rels, key=lambda r: r.target_label or ""):
+                for rel in rels:
                     target_label = rel.target_label or rel.target_id
                     cardinality_desc = self._describe_cardinality(rel.cardinality)
 
                     # List up to 8 representative members of the target domain
-                    target_members = sorted(
-                        a.label for a in self.assets.values()
-                        if a.parent_group == target_label and a.label.upper() != target_label.upper()
-                    )
+                    target_members = members_by_group.get(target_label, [])
                     target_sample = target_members[:8]
                     target_ctx = (
                         f" (including {', '.join(target_sample)}"
@@ -620,25 +790,96 @@ class LeanIXExtractor:
                         if target_sample else ""
                     )
 
-                    md.append(
+                    w(
                         f"{source_label}{source_ctx} {cardinality_desc} "
                         f"{target_label}{target_ctx}.\n\n"
                     )
 
-        return "".join(md)
+        return buf.getvalue()
+
+    @functools.cached_property
+    def assets_by_type(self) -> Dict[str, List[LeanIXAsset]]:
+        """Assets grouped by fact sheet type, in first-seen order.
+
+        Built on first use and reused by to_dict() and the CLI summary.
+        Call after extract_all().
+        """
+        by_type: Dict[str, List[LeanIXAsset]] = defaultdict(list)
+        for asset in self.assets.values():
+            by_type[asset.fact_sheet_type].append(asset)
+        return dict(by_type)
+
+    @functools.cached_property
+    def render_model(self) -> _RenderModel:
+        """Grouping, sorting and bucketing shared by to_markdown and to_section_files.
+
+        Built on first use and reused, so saving both outputs does the
+        structural work once. Call after extract_all(); assets and
+        relationships are not expected to change afterwards.
+        """
+        assets_by_group: Dict[str, List[LeanIXAsset]] = defaultdict(list)
+        for asset in self.assets.values():
+            assets_by_group[asset.parent_group or "Uncategorized"].append(asset)
+        uncategorized = self._bucket_uncategorized(assets_by_group.pop("Uncategorized", []))
+        for bucket in uncategorized:
+            bucket.sort()
+        for group_assets in assets_by_group.values():
+            group_assets.sort(key=lambda a: a.label)
+
+        rels_by_source: Dict[str, List[LeanIXRelationship]] = defaultdict(list)
+        rels_by_domain: Dict[str, List[LeanIXRelationship]] = defaultdict(list)
+        for rel in self.relationships:
+            rels_by_source[rel.source_label or rel.source_id].append(rel)
+            if rel.source_label is not None:
+                rels_by_domain[rel.source_label].append(rel)
+            if rel.target_label is not None and rel.target_label != rel.source_label:
+                rels_by_domain[rel.target_label].append(rel)
+
+        return _RenderModel(
+            domain_names=sorted(assets_by_group.keys()),
+            assets_by_group=dict(assets_by_group),
+            uncategorized=uncategorized,
+            members_by_group=self._members_by_group(),
+            rels_by_source={
+                source: sorted(rels_by_source[source], key=lambda r: r.target_label or "")
+                for source in sorted(rels_by_source.keys())
+            },
+            rels_by_domain={
+                label: sorted(rels, key=lambda r: r.target_label or "")
+                for label, rels in rels_by_domain.items()
+            },
+        )
+
+    def _bucket_uncategorized(self, assets: List[LeanIXAsset]) -> _UncategorizedBuckets:
+        """Split uncategorized asset labels into party/channel/account/asset/other lists.
+
+        Called once per extractor from render_model; both renderers unpack the
+        cached result.
+        """
+        buckets: Dict[str, List[str]] = {name: [] for name in _UncategorizedBuckets._fields}
+        for asset in assets:
+            buckets[_classify_uncategorized(asset.label)].append(asset.label)
+        return _UncategorizedBuckets(**buckets)
+
+    def _members_by_group(self) -> Dict[str, List[str]]:
+        """Map each domain to the sorted labels of its members, excluding the root label.
+
+        Built once per render so relationship sections look members up by
+        domain instead of rescanning every asset for each relationship.
+        """
+        by_group: Dict[str, List[str]] = defaultdict(list)
+        for asset in self.assets.values():
+            group = asset.parent_group
+            if group is not None and asset.label_upper != group.upper():
+                by_group[group].append(asset.label)
+        for labels in by_group.values():
+            labels.sort()
+        return by_group
 
     def _describe_cardinality(self, cardinality: Optional[str]) -> str:
         """Convert cardinality notation to a natural language phrase."""
-        mapping = {
-            "0..*-0..*": "relates to (zero or more to zero or more)",
-            "1..*-0..*": "relates to (one or more to zero or more)",
-            "0..*-1..*": "relates to (zero or more to one or more)",
-            "1..1-0..*": "relates to (exactly one to zero or more)",
-            "0..*-1..1": "relates to (zero or more to exactly one)",
-            "1..1-1..1": "relates to (exactly one to exactly one)",
-        }
-        if cardinality and cardinality in mapping:
-            return mapping[cardinality]
+        if cardinality and cardinality in _CARDINALITY_PHRASES:
+            return _CARDINALITY_PHRASES[cardinality]
         return f"relates to ({cardinality})" if cardinality else "relates to"
     
     def _detect_type3_domains(self):
@@ -786,6 +1027,7 @@ class LeanIXExtractor:
         for group_id, domain_name in self.groups.items():
             if not domain_name:
                 continue
+            domain_upper = domain_name.upper()
 
             subgroup_boxes: List[Tuple[str, float, float, float, float]] = []
             leaf_assets: List[LeanIXAsset] = []
@@ -793,7 +1035,7 @@ class LeanIXExtractor:
             for asset in self.assets.values():
                 if asset.parent_id != group_id:
                     continue
-                if asset.label.upper() == domain_name.upper():
+                if asset.label_upper == domain_upper:
                     continue  # skip the root domain label node
 
                 w = asset.width or 0
@@ -837,20 +1079,30 @@ class LeanIXExtractor:
             names (e.g. 'agreements', 'product', 'transaction_and_events') plus
             'overview', 'additional_entities', and 'relationships'.
         """
-        sections: Dict[str, str] = {}
+        return {key: "".join(fragments) for key, fragments in self._iter_sections()}
 
-        # Build domain → assets mapping
-        assets_by_group: Dict[str, List[LeanIXAsset]] = defaultdict(list)
-        for asset in self.assets.values():
-            group = asset.parent_group or "Uncategorized"
-            assets_by_group[group].append(asset)
-        uncategorized_assets = assets_by_group.pop("Uncategorized", [])
-        domain_names = sorted(assets_by_group.keys())
+    def _iter_sections(self) -> Iterator[Tuple[str, Iterator[str]]]:
+        """Yield (section_key, fragments) pairs in output order.
 
-        # ── Overview ──────────────────────────────────────────────────────────
-        md: List[str] = []
-        md.append(f"# {self.model_name} — Overview\n\n")
-        md.append(
+        Each section is a lazy iterator of Markdown fragments, so save_sections()
+        can stream it straight into the file without materialising the text.
+        """
+        model = self.render_model
+        yield "overview", self._iter_overview_section()
+        for group_name in model.domain_names:
+            yield self._sanitize_section_key(group_name), self._iter_domain_section(group_name)
+        if any(model.uncategorized):
+            yield "additional_entities", self._iter_additional_entities_section()
+        if self.relationships:
+            yield "relationships", self._iter_relationships_section()
+
+    def _iter_overview_section(self) -> Iterator[str]:
+        """Overview section: model summary and per-domain entity counts."""
+        model = self.render_model
+        domain_names = model.domain_names
+
+        yield f"# {self.model_name} — Overview\n\n"
+        yield (
             f"The {self.model_name} (source: {self.xml_file.name}) "
             f"contains {len(self.assets)} DataObject entities organised into "
             f"{len(domain_names)} named domain groups: {', '.join(domain_names)}. "
@@ -858,199 +1110,159 @@ class LeanIXExtractor:
             f"relationships.\n\n"
         )
         for group_name in domain_names:
-            group_assets = assets_by_group[group_name]
+            group_assets = model.assets_by_group[group_name]
             # Exclude domain root label and labels actively used as subgroup headings.
             # Geometry-only filtering is avoided: some entities (e.g. Team, Household)
             # have wider boxes but are genuine entities, not containers.
+            group_upper = group_name.upper()
             used_subgroups = {a.subgroup for a in group_assets if a.subgroup}
             leaf_count = sum(
                 1 for a in group_assets
-                if a.label.upper() != group_name.upper()
+                if a.label_upper != group_upper
                 and a.label not in used_subgroups
             )
-            md.append(f"The **{group_name}** domain contains {leaf_count} entities.\n\n")
-        sections["overview"] = "".join(md)
-
-        # ── One section per domain ────────────────────────────────────────────
-        for group_name in domain_names:
-            group_assets = sorted(assets_by_group[group_name], key=lambda a: a.label)
-            # Exclude domain root label and labels actively used as subgroup headings.
-            # A label that no entity references as its subgroup is a genuine entity.
-            used_subgroups = {a.subgroup for a in group_assets if a.subgroup}
-            leaf_entities = [
-                a for a in group_assets
-                if a.label.upper() != group_name.upper()
-                and a.label not in used_subgroups
-            ]
+            yield f"The **{group_name}** domain contains {leaf_count} entities.\n\n"
+
+    def _iter_domain_section(self, group_name: str) -> Iterator[str]:
+        """One domain section: leaf entities (by subgroup) and touching relationships."""
+        group_assets = self.render_model.assets_by_group[group_name]
+        # Exclude domain root label and labels actively used as subgroup headings.
+        # A label that no entity references as its subgroup is a genuine entity.
+        group_upper = group_name.upper()
+        used_subgroups = {a.subgroup for a in group_assets if a.subgroup}
+        leaf_entities = [
+            a for a in group_assets
+            if a.label_upper != group_upper
+            and a.label not in used_subgroups
+        ]
 
-            md = []
-            md.append(f"# {group_name} Domain — {self.model_name}\n\n")
-            md.append(
-                f"The {group_name} domain is part of the {self.model_name}. "
-                f"It contains {len(leaf_entities)} entities.\n\n"
-            )
-            if leaf_entities:
-                md.append(f"The entities within the {group_name} domain are:\n\n")
-                has_subgroups = any(a.subgroup for a in leaf_entities)
-                if has_subgroups:
-                    by_subgroup: Dict[str, List[LeanIXAsset]] = defaultdict(list)
-                    unassigned: List[LeanIXAsset] = []
-                    for asset in leaf_entities:
-                        if asset.subgroup:
-                            by_subgroup[asset.subgroup].append(asset)
-                        else:
-                            unassigned.append(asset)
-                    for sg_name in sorted(by_subgroup.keys()):
-                        md.append(f"## {sg_name} Subgroup\n\n")
-                        for asset in sorted(by_subgroup[sg_name], key=lambda a: a.label):
-                            fsid = f" *(LeanIX ID: `{asset.fact_sheet_id}`)*" if asset.fact_sheet_id else ""
-                            md.append(f"- **{asset.label}**{fsid}\n")
-                        md.append("\n")
-                    for asset in sorted(unassigned, key=lambda a: a.label):
-                        fsid = f" *(LeanIX ID: `{asset.fact_sheet_id}`)*" if asset.fact_sheet_id else ""
-                        md.append(f"- **{asset.label}**{fsid}\n")
-                    if unassigned:
-                        md.append("\n")
-                else:
-                    for asset in leaf_entities:
+        yield f"# {group_name} Domain — {self.model_name}\n\n"
+        yield (
+            f"The {group_name} domain is part of the {self.model_name}. "
+            f"It contains {len(leaf_entities)} entities.\n\n"
+        )
+        if leaf_entities:
+            yield f"The entities within the {group_name} domain are:\n\n"
+            has_subgroups = any(a.subgroup for a in leaf_entities)
+            if has_subgroups:
+                # group_assets is label-sorted, so each bucket below stays sorted
+                by_subgroup: Dict[str, List[LeanIXAsset]] = defaultdict(list)
+                unassigned: List[LeanIXAsset] = []
+                for asset in leaf_entities:
+                    if asset.subgroup:
+                        by_subgroup[asset.subgroup].append(asset)
+                    else:
+                        unassigned.append(asset)
+                for sg_name in sorted(by_subgroup.keys()):
+                    yield f"## {sg_name} Subgroup\n\n"
+                    for asset in by_subgroup[sg_name]:
                         fsid = f" *(LeanIX ID: `{asset.fact_sheet_id}`)*" if asset.fact_sheet_id else ""
-                        md.append(f"- **{asset.label}**{fsid}\n")
-                    md.append("\n")
-
-            # Include relationships that touch this domain (for co-location context)
-            domain_rels = [
-                r for r in self.relationships
-                if r.source_label == group_name or r.target_label == group_name
-            ]
-            if domain_rels:
-                md.append(f"## {group_name} Domain Relationships\n\n")
-                for rel in sorted(domain_rels, key=lambda r: r.target_label or ""):
-                    source = rel.source_label or rel.source_id
-                    target = rel.target_label or rel.target_id
-                    cardinality_desc = self._describe_cardinality(rel.cardinality)
-                    md.append(f"- **{source}** {cardinality_desc} **{target}**\n")
-                md.append("\n")
-
-            section_key = self._sanitize_section_key(group_name)
-            sections[section_key] = "".join(md)
-
-        # ── Additional entities (uncategorized: party types, channels, etc.) ──
-        if uncategorized_assets:
-            party_types: List[str] = []
-            channel_types: List[str] = []
-            account_types: List[str] = []
-            asset_types: List[str] = []
-            other: List[str] = []
-
-            for asset in uncategorized_assets:
-                label = asset.label.lower()
-                if any(p in label for p in [
-                    'player', 'club', 'team', 'individual', 'organisation', 'employee',
-                    'customer', 'member', 'official', 'learner', 'prospect', 'supplier',
-                    'county', 'charity', 'government', 'school', 'authority', 'candidate',
-                    'mentor', 'developer', 'household', 'unit', 'supporter', 'attendee',
-                ]):
-                    party_types.append(asset.label)
-                elif any(c in label for c in [
-                    'channel', 'broadcast', 'streaming', 'tv', 'radio', 'sms', 'email',
-                    'mobile', 'web', 'portal', 'social', 'push', 'live', 'chat',
-                    'call centre', 'concierge', 'in person', 'pos', 'turnstile', 'merchandise',
-                ]):
-                    channel_types.append(asset.label)
-                elif 'account' in label:
-                    account_types.append(asset.label)
-                elif 'asset' in label or 'data' in label or 'property' in label:
-                    asset_types.append(asset.label)
-                else:
-                    other.append(asset.label)
-
-            md = []
-            md.append(f"# Additional Entities — {self.model_name}\n\n")
-            md.append(
-                f"The following entities are defined in the {self.model_name} "
-                "and include key party, channel, account, and asset entities that form the "
-                f"core of {self.org_name}'s data landscape.\n\n"
+                        yield f"- **{asset.label}**{fsid}\n"
+                    yield "\n"
+                for asset in unassigned:
+                    fsid = f" *(LeanIX ID: `{asset.fact_sheet_id}`)*" if asset.fact_sheet_id else ""
+                    yield f"- **{asset.label}**{fsid}\n"
+                if unassigned:
+                    yield "\n"
+            else:
+                for asset in leaf_entities:
+                    fsid = f" *(LeanIX ID: `{asset.fact_sheet_id}`)*" if asset.fact_sheet_id else ""
+                    yield f"- **{asset.label}**{fsid}\n"
+                yield "\n"
+
+        # Include relationships that touch this domain (for co-location context)
+        domain_rels = self.render_model.rels_by_domain.get(group_name)
+        if domain_rels:
+            yield f"## {group_name} Domain Relationships\n\n"
+            for rel in domain_rels:
+                source = rel.source_label or rel.source_id
+                target = rel.target_label or rel.target_id
+                cardinality_desc = self._describe_cardinality(rel.cardinality)
+                yield f"- **{source}** {cardinality_desc} **{target}**\n"
+            yield "\n"
+
+    def _iter_additional_entities_section(self) -> Iterator[str]:
+        """Uncategorized entities (party types, channels, etc.) by keyword bucket."""
+        party_types, channel_types, account_types, asset_types, other = self.render_model.uncategorized
+
+        yield f"# Additional Entities — {self.model_name}\n\n"
+        yield (
+            f"The following entities are defined in the {self.model_name} "
+            "and include key party, channel, account, and asset entities that form the "
+            f"core of {self.org_name}'s data landscape.\n\n"
+        )
+        if party_types:
+            yield (
+                f"**Party Types ({len(party_types)} entities):** "
+                f"{', '.join(party_types)}.\n\n"
             )
-            if party_types:
-                md.append(
-                    f"**Party Types ({len(party_types)} entities):** "
-                    f"{', '.join(sorted(party_types))}.\n\n"
-                )
-            if channel_types:
-                md.append(
-                    f"**Channel Types ({len(channel_types)} entities):** "
-                    f"{', '.join(sorted(channel_types))}.\n\n"
-                )
-            if account_types:
-                md.append(
-                    f"**Account Types ({len(account_types)} entities):** "
-                    f"{', '.join(sorted(account_types))}.\n\n"
-                )
-            if asset_types:
-                md.append(
-                    f"**Asset Types ({len(asset_types)} entities):** "
-                    f"{', '.join(sorted(asset_types))}.\n\n"
-                )
-            if other:
-                md.append(
-                    f"**Other Entities ({len(other)} entities):** "
-                    f"{', '.join(sorted(other))}.\n\n"
-                )
-            sections["additional_entities"] = "".join(md)
-
-        # ── Relationships: one headed section per relationship for clean chunking ──
-        if self.relationships:
-            md = []
-            md.append(f"# Entity Relationships — {self.model_name}\n\n")
-            md.append(
-                f"This document lists all {len(self.relationships)} domain-level entity "
-                f"relationships in the {self.model_name}. "
-                "Each relationship section is self-contained: it names the source and target "
-                "domains, states the cardinality, and lists representative entities from each "
-                "domain so that any retrieved chunk carries full context.\n\n"
+        if channel_types:
+            yield (
+                f"**Channel Types ({len(channel_types)} entities):** "
+                f"{', '.join(channel_types)}.\n\n"
+            )
+        if account_types:
+            yield (
+                f"**Account Types ({len(account_types)} entities):** "
+                f"{', '.join(account_types)}.\n\n"
+            )
+        if asset_types:
+            yield (
+                f"**Asset Types ({len(asset_types)} entities):** "
+                f"{', '.join(asset_types)}.\n\n"
+            )
+        if other:
+            yield (
+                f"**Other Entities ({len(other)} entities):** "
+                f"{', '.join(other)}.\n\n"
             )
 
-            rels_by_source: Dict[str, List[LeanIXRelationship]] = defaultdict(list)
-            for rel in self.relationships:
-                rels_by_source[rel.source_label or rel.source_id].append(rel)
+    def _iter_relationships_section(self) -> Iterator[str]:
+        """Relationships: one headed section per relationship for clean chunking."""
+        model = self.render_model
+
+        yield f"# Entity Relationships — {self.model_name}\n\n"
+        yield (
+            f"This document lists all {len(self.relationships)} domain-level entity "
+            f"relationships in the {self.model_name}. "
+            "Each relationship section is self-contained: it names the source and target "
+            "domains, states the cardinality, and lists representative entities from each "
+            "domain so that any retrieved chunk carries full context.\n\n"
+        )
 
-            for source_label in sorted(rels_by_source.keys()):
-                for rel in sorted(rels_by_source[source_label], key=lambda r: r.target_label or ""):
-                    target_label = rel.target_label or rel.target_id
-                    cardinality_desc = self._describe_cardinality(rel.cardinality)
+        members_by_group = model.members_by_group
 
-                    source_members = sorted(
-                        a.label for a in self.assets.values()
-                        if a.parent_group == source_label and a.label.upper() != source_label.upper()
-                    )
-                    target_members = sorted(
-                        a.label for a in self.assets.values()
-                        if a.parent_group == target_label and a.label.upper() != target_label.upper()
-                    )
+        for source_label, rels in model.rels_by_source.items():
+            source_members = members_by_group.get(source_label, [])
+            for rel in rels:
+                target_label = rel.target_label or rel.target_id
+                cardinality_desc = self._describe_cardinality(rel.cardinality)
+                target_members = members_by_group.get(target_label, [])
 
-                    md.append(f"## Relationship: {source_label} → {target_label}\n\n")
-                    md.append(
-                        f"**{source_label}** {cardinality_desc} **{target_label}**.\n\n"
+                yield (
+                    f"## Relationship: {source_label} → {target_label}\n\n"
+                    f"**{source_label}** {cardinality_desc} **{target_label}**.\n\n"
+                )
+                if source_members:
+                    yield (
+                        f"The **{source_label}** domain includes entities: "
+                        f"{', '.join(source_members[:12])}"
+                        f"{'...' if len(source_members) > 12 else ''}.\n\n"
+                    )
+                if target_members:
+                    yield (
+                        f"The **{target_label}** domain includes entities: "
+                        f"{', '.join(target_members[:12])}"
+                        f"{'...' if len(target_members) > 12 else ''}.\n\n"
                     )
-                    if source_members:
-                        md.append(
-                            f"The **{source_label}** domain includes entities: "
-                            f"{', '.join(source_members[:12])}"
-                            f"{'...' if len(source_members) > 12 else ''}.\n\n"
-                        )
-                    if target_members:
-                        md.append(
-                            f"The **{target_label}** domain includes entities: "
-                            f"{', '.join(target_members[:12])}"
-                            f"{'...' if len(target_members) > 12 else ''}.\n\n"
-                        )
-            sections["relationships"] = "".join(md)
-
-        return sections
 
     def save_sections(self, output_dir: str, prefix: str = "") -> Dict[str, str]:
         """Write each section to a separate Markdown file in output_dir.
 
+        Sections are streamed fragment by fragment into their files rather than
+        being joined into one string first. Files are written concurrently on a
+        small thread pool; file I/O releases the GIL.
+
         Args:
             output_dir: Directory to write files into (created if it doesn't exist).
             prefix: Optional filename prefix (e.g. 'leanix_').
@@ -1061,20 +1273,24 @@ class LeanIXExtractor:
         output_dir_path = Path(output_dir)
         output_dir_path.mkdir(parents=True, exist_ok=True)
 
-        sections = self.to_section_files()
-        file_map: Dict[str, str] = {}
-
-        for section_key, content in sections.items():
+        # Keyed by section so a repeated key keeps only its last content,
+        # matching to_section_files().
+        jobs: Dict[str, Tuple[Path, Iterator[str]]] = {}
+        for section_key, fragments in self._iter_sections():
             filename = f"{prefix}{section_key}.md" if prefix else f"{section_key}.md"
-            file_path = output_dir_path / filename
-            with open(file_path, "w", encoding="utf-8") as f:
-                f.write(content)
+            jobs[section_key] = (output_dir_path / filename, fragments)
+
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            list(executor.map(lambda job: _write_fragments(*job), jobs.values()))
+
+        file_map: Dict[str, str] = {}
+        for section_key, (file_path, _) in jobs.items():
             file_map[section_key] = str(file_path)
             print(f"  Saved section '{section_key}' → {file_path}")
 
         return file_map
 
-    def save(self, output_path: str, format: str = "both"):
+    def save(self, output_path: str, format: str = "both") -> Optional[Path]:
         """Save extracted data to file(s).
 
         Args:
@@ -1082,20 +1298,26 @@ class LeanIXExtractor:
             format: 'json', 'markdown'/'md', 'both', or 'csv' (alias for structured JSON output).
                 'csv' writes <stem>_model.json alongside
                 <stem>_entities.md and <stem>_relationships.md for RAG ingestion.
+
+        Returns:
+            Path of the primary file written (the Markdown file when there is
+            one, else the JSON file), or None for an unknown format.
         """
         output_path = Path(output_path)
+        primary: Optional[Path] = None
 
         if format in ("json", "both"):
             json_file = output_path if format == "json" else output_path.with_suffix('.json')
-            with open(json_file, 'w', encoding='utf-8') as f:
-                f.write(self.to_json())
+            self.write_json(json_file)
             print(f"Saved JSON to {json_file}")
+            primary = json_file
 
         if format in ("markdown", "md", "both"):
             md_file = output_path if format in ("markdown", "md") else output_path.with_suffix('.md')
             with open(md_file, 'w', encoding='utf-8') as f:
                 f.write(self.to_markdown())
             print(f"Saved Markdown to {md_file}")
+            primary = md_file
 
         if format == "csv":
             # 'csv' is a legacy alias — outputs _model.json + flat markdowns (no CSV files)
@@ -1111,6 +1333,9 @@ class LeanIXExtractor:
             print(f"Saved model JSON to {model_json} ({len(rows)} entities, {len(self.relationships)} relationships)")
             print(f"Saved entities Markdown to {entities_md}")
             print(f"Saved relationships Markdown to {rels_md}")
+            primary = entities_md
+
+        return primary
 
 
 def extract_leanix_file(input_path: str, output_path: str, format: str = "markdown") -> str:
@@ -1119,24 +1344,71 @@ def extract_leanix_file(input_path: str, output_path: str, format: str = "markdo
     Args:
         input_path: Path to input XML file.
         output_path: Path for output file.
-        format: Output format - 'json', 'markdown', 'md', or 'both'.
+        format: Output format - 'json', 'markdown', 'md', 'both' or 'csv'.
         
     Returns:
         Path to the primary output file.
+
+    Raises:
+        ValueError: If ``format`` is not one :meth:`LeanIXExtractor.save` writes.
     """
+    if format not in _SAVE_FORMATS:
+        raise ValueError(f"Unknown LeanIX output format: {format!r}")
     extractor = LeanIXExtractor(input_path)
     extractor.parse_xml()
     extractor.extract_all()
-    extractor.save(output_path, format)
-    
-    # Return the primary output file path
-    if format in ("markdown", "md"):
-        return str(Path(output_path).with_suffix('.md'))
-    elif format == "json":
-        return str(Path(output_path).with_suffix('.json'))
-    else:
-        # For 'both', return markdown as primary
-        return str(Path(output_path).with_suffix('.md'))
+    return str(extractor.save(output_path, format))
+
+
+def extract_leanix_files(
+    input_paths: List[str],
+    output_dir: str,
+    format: str = "markdown",
+    workers: Optional[int] = None,
+) -> List[str]:
+    """Extract several LeanIX XML exports, one worker process per file.
+
+    Parsing and label cleaning are CPU-bound, so files are spread over a
+    process pool rather than threads; a single file is extracted in-process.
+    Each output is written to ``output_dir`` under the input file's stem.
+
+    Args:
+        input_paths: Paths to input XML files.
+        output_dir: Directory for the output files (created if missing).
+        format: Output format - 'json', 'markdown', 'md', or 'both'.
+        workers: Maximum worker processes (default: CPU count).
+
+    Returns:
+        Paths to the primary output files, in input order.
+
+    Raises:
+        ValueError: If two inputs share a stem (e.g. the same file name in
+            different directories) and would write the same output.
+    """
+    out_dir = Path(output_dir)
+    output_paths = [str(out_dir / Path(p).stem) for p in input_paths]
+
+    # Checked before any work starts: workers would write the same file at once
+    claimed: Dict[str, str] = {}
+    for input_path, output_path in zip(input_paths, output_paths):
+        if output_path in claimed:
+            raise ValueError(
+                f"{claimed[output_path]} and {input_path} would both be written to {output_path}"
+            )
+        claimed[output_path] = input_path
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    if len(input_paths) <= 1:
+        return [
+            extract_leanix_file(input_path, output_path, format)
+            for input_path, output_path in zip(input_paths, output_paths)
+        ]
+
+    with ProcessPoolExecutor(max_workers=workers) as ex:
+        return list(
+            ex.map(extract_leanix_file, input_paths, output_paths, [format] * len(input_paths))
+        )
 
 
 def main():
@@ -1175,13 +1447,9 @@ def main():
     print(f"Total relationships: {len(extractor.relationships)}")
     
     # Show asset types
-    asset_types = defaultdict(int)
-    for asset in extractor.assets.values():
-        asset_types[asset.fact_sheet_type] += 1
-    
     print("\nAsset types:")
-    for atype, count in sorted(asset_types.items()):
-        print(f"  {atype}: {count}")
+    for atype, assets in sorted(extractor.assets_by_type.items()):
+        print(f"  {atype}: {len(assets)}")
 
 
 if __name__ == "__main__":
@@ -4,6 +4,9 @@ from __future__ import annotations
 
 import hashlib
 import logging
+import os
+import weakref
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +21,16 @@ FILE_HASH_COLLECTION = "file_hashes"
 # Dummy embedding dimension (we query by ID, not similarity)
 EMBEDDING_DIM = 1
 
+# Shared zero embedding for every hash record (we query by ID only).
+# Passed to Chroma by reference - never mutate it.
+_ZERO_EMBED: list[float] = [0.0] * EMBEDDING_DIM
+
+# file_hashes collection handle per client, so each hash operation doesn't
+# re-fetch it; weak keys let the entry go when the client is dropped
+_HASH_COLLECTIONS: weakref.WeakKeyDictionary[chromadb.ClientAPI, chromadb.Collection] = (
+    weakref.WeakKeyDictionary()
+)
+
 
 def compute_file_hash(file_path: str | Path) -> str:
     """Compute SHA256 hash of a file.
@@ -29,14 +42,10 @@ def compute_file_hash(file_path: str | Path) -> str:
         Hexadecimal SHA256 hash string.
     """
     file_path = Path(file_path).expanduser()
-    sha256_hash = hashlib.sha256()
 
     with open(file_path, "rb") as f:
-        # Read in chunks for large files
-        for chunk in iter(lambda: f.read(8192), b""):
-            sha256_hash.update(chunk)
-
-    return sha256_hash.hexdigest()
+        # Reads into a reusable buffer and hashes in C, releasing the GIL
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _get_hash_collection(
@@ -44,21 +53,22 @@ def _get_hash_collection(
 ) -> chromadb.Collection:
     """Get or create the file_hashes collection.
 
+    The handle is cached per client after the first lookup.
+
     Args:
         client: ChromaDB client.
 
     Returns:
         The file_hashes collection.
     """
-    try:
-        collection = client.get_collection(name=FILE_HASH_COLLECTION)
-        logger.debug("Using existing file_hashes collection")
-    except Exception:
-        collection = client.create_collection(
+    collection = _HASH_COLLECTIONS.get(client)
+    if collection is None:
+        collection = client.get_or_create_collection(
             name=FILE_HASH_COLLECTION,
             metadata={"description": "File hash tracking for smart ingest"},
         )
-        logger.debug("Created file_hashes collection")
+        _HASH_COLLECTIONS[client] = collection
+        logger.debug("Using file_hashes collection")
 
     return collection
 
@@ -77,6 +87,49 @@ def _file_path_to_id(file_path: str, collection_name: str) -> str:
     return f"{collection_name}::{file_path}"
 
 
+def _stat_metadata(file_path: str, st: os.stat_result | None = None) -> dict[str, int]:
+    """Return the ``mtime_ns``/``size`` fields stored alongside a hash.
+
+    Uses ``st`` when the caller already has it. Empty if the file cannot be
+    stat'ed, so the record simply has no fast path.
+    """
+    if st is None:
+        try:
+            st = Path(file_path).stat()
+        except OSError:
+            return {}
+    return {"mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _stat_matches(stat_meta: dict[str, int], stored: dict[str, Any] | None) -> bool:
+    """True if the file's current stat fields equal the stored ones."""
+    return bool(
+        stat_meta
+        and stored
+        and stored.get("mtime_ns") == stat_meta["mtime_ns"]
+        and stored.get("size") == stat_meta["size"]
+    )
+
+
+def _get_stored_metadata(
+    client: chromadb.ClientAPI,
+    file_path: str,
+    collection_name: str,
+) -> dict[str, Any] | None:
+    """Retrieve the stored hash record (hash plus stat fields) for a file."""
+    doc_id = _file_path_to_id(file_path, collection_name)
+    collection = _get_hash_collection(client)
+
+    try:
+        result = collection.get(ids=[doc_id])
+        if result["ids"]:
+            return result["metadatas"][0]
+    except Exception as e:
+        logger.warning("Error retrieving hash for %s: %s", file_path, e)
+
+    return None
+
+
 def get_stored_hash(
     client: chromadb.ClientAPI,
     file_path: str,
@@ -92,17 +145,11 @@ def get_stored_hash(
     Returns:
         Stored hash if found, None otherwise.
     """
-    doc_id = _file_path_to_id(file_path, collection_name)
-    collection = _get_hash_collection(client)
-
-    try:
-        result = collection.get(ids=[doc_id])
-        if result["ids"]:
-            stored_hash = result["metadatas"][0].get("hash")
-            logger.debug("Found stored hash for %s: %s", file_path, stored_hash[:8] if stored_hash else None)
-            return stored_hash
-    except Exception as e:
-        logger.warning("Error retrieving hash for %s: %s", file_path, e)
+    stored = _get_stored_metadata(client, file_path, collection_name)
+    if stored is not None:
+        stored_hash = stored.get("hash")
+        logger.debug("Found stored hash for %s: %s", file_path, stored_hash[:8] if stored_hash else None)
+        return stored_hash
 
     logger.debug("No stored hash found for %s", file_path)
     return None
@@ -116,6 +163,9 @@ def store_file_hash(
 ) -> None:
     """Store or update file hash in ChromaDB.
 
+    The file's ``mtime_ns`` and ``size`` are stored with the hash so later
+    change checks can skip hashing files whose stat is unchanged.
+
     Args:
         client: ChromaDB client.
         file_path: Path to the file.
@@ -128,36 +178,63 @@ def store_file_hash(
     doc_id = _file_path_to_id(file_path, collection_name)
     collection = _get_hash_collection(client)
 
-    # Use zero embedding (we query by ID only)
-    embedding = [0.0] * EMBEDDING_DIM
-
     metadata = {
         "file_path": file_path,
         "hash": file_hash,
         "collection_name": collection_name,
+        **_stat_metadata(file_path),
     }
 
-    # Check if exists - update or add
+    # Insert or update in a single call
     try:
-        existing = collection.get(ids=[doc_id])
-        if existing["ids"]:
-            collection.update(
-                ids=[doc_id],
-                embeddings=[embedding],
-                metadatas=[metadata],
-            )
-            logger.debug("Updated hash for %s", file_path)
-        else:
-            collection.add(
-                ids=[doc_id],
-                embeddings=[embedding],
-                metadatas=[metadata],
-            )
-            logger.debug("Stored new hash for %s", file_path)
+        collection.upsert(
+            ids=[doc_id],
+            embeddings=[_ZERO_EMBED],
+            metadatas=[metadata],
+        )
+        logger.debug("Stored hash for %s", file_path)
     except Exception as e:
         logger.error("Failed to store hash for %s: %s", file_path, e)
 
 
+def store_file_hashes(
+    client: chromadb.ClientAPI,
+    file_hashes: list[tuple[str, str]],
+    collection_name: str,
+) -> None:
+    """Store or update hashes for many files in one ChromaDB upsert.
+
+    Args:
+        client: ChromaDB client.
+        file_hashes: ``(file_path, hash)`` pairs.
+        collection_name: Name of the target collection.
+    """
+    if not file_hashes:
+        return
+
+    collection = _get_hash_collection(client)
+    ids = [_file_path_to_id(fp, collection_name) for fp, _ in file_hashes]
+    metadatas = [
+        {
+            "file_path": fp,
+            "hash": file_hash,
+            "collection_name": collection_name,
+            **_stat_metadata(fp),
+        }
+        for fp, file_hash in file_hashes
+    ]
+
+    try:
+        collection.upsert(
+            ids=ids,
+            embeddings=[_ZERO_EMBED] * len(ids),
+            metadatas=metadatas,
+        )
+        logger.debug("Stored %d file hashes", len(ids))
+    except Exception as e:
+        logger.error("Failed to store %d file hashes: %s", len(ids), e)
+
+
 def is_file_changed(
     client: chromadb.ClientAPI,
     file_path: str,
@@ -165,6 +242,9 @@ def is_file_changed(
 ) -> bool:
     """Check if a file has changed since last ingestion.
 
+    Files whose ``mtime_ns`` and ``size`` match the stored record are treated
+    as unchanged without being read; only the rest are hashed.
+
     Args:
         client: ChromaDB client.
         file_path: Path to the file.
@@ -175,6 +255,12 @@ def is_file_changed(
     """
     file_path = str(Path(file_path).expanduser())
 
+    stored = _get_stored_metadata(client, file_path, collection_name)
+    stat_meta = _stat_metadata(file_path)
+    if _stat_matches(stat_meta, stored):
+        logger.info("File unchanged: %s", file_path)
+        return False
+
     # Compute current hash
     try:
         current_hash = compute_file_hash(file_path)
@@ -182,8 +268,7 @@ def is_file_changed(
         logger.warning("Failed to compute hash for %s: %s", file_path, e)
         return True  # Assume changed if we can't hash
 
-    # Get stored hash
-    stored_hash = get_stored_hash(client, file_path, collection_name)
+    stored_hash = stored.get("hash") if stored else None
 
     if stored_hash is None:
         logger.info("New file (no stored hash): %s", file_path)
@@ -193,10 +278,96 @@ def is_file_changed(
         logger.info("File changed: %s", file_path)
         return True
 
+    # Same content, new stat (touched/copied): refresh so it isn't re-hashed
+    store_file_hash(client, file_path, collection_name, current_hash)
     logger.info("File unchanged: %s", file_path)
     return False
 
 
+def _try_compute_file_hash(file_path: str) -> str | None:
+    """Hash a file, returning None (treated as changed) if it cannot be read."""
+    try:
+        return compute_file_hash(file_path)
+    except Exception as e:
+        logger.warning("Failed to compute hash for %s: %s", file_path, e)
+        return None
+
+
+def filter_changed_files(
+    client: chromadb.ClientAPI,
+    file_paths: list[str],
+    collection_name: str,
+    file_stats: list[os.stat_result] | None = None,
+) -> dict[str, str | None]:
+    """Return the files that are new or have changed since last ingestion.
+
+    Batch form of :func:`is_file_changed`: stored hashes for every candidate
+    are fetched with one ChromaDB query, files whose stat still matches are
+    skipped, and the remaining hashes are computed on a thread pool
+    (``hashlib`` releases the GIL while hashing).
+
+    Args:
+        client: ChromaDB client.
+        file_paths: List of file paths.
+        collection_name: Name of the target collection.
+        file_stats: Optional ``os.stat`` results aligned with ``file_paths``,
+            for callers that have already stat'ed the files.
+
+    Returns:
+        Changed or new file paths (expanded), in input order, mapped to the
+        content hash just computed (``None`` if the file could not be read),
+        so callers can record it after ingestion without hashing again.
+    """
+    paths = [str(Path(fp).expanduser()) for fp in file_paths]
+    stats = file_stats if file_stats is not None else [None] * len(paths)
+    if not paths:
+        return {}
+
+    collection = _get_hash_collection(client)
+    ids = [_file_path_to_id(p, collection_name) for p in paths]
+
+    stored: dict[str, dict[str, Any]] = {}
+    try:
+        result = collection.get(ids=ids)
+        stored = {
+            id_: meta or {} for id_, meta in zip(result["ids"], result["metadatas"])
+        }
+    except Exception as e:
+        logger.warning("Error retrieving stored hashes: %s", e)
+
+    # Only hash files whose mtime/size no longer match the stored record
+    to_hash: list[tuple[str, str]] = []
+    for path, doc_id, st in zip(paths, ids, stats):
+        if _stat_matches(_stat_metadata(path, st), stored.get(doc_id)):
+            logger.info("File unchanged: %s", path)
+        else:
+            to_hash.append((path, doc_id))
+
+    with ThreadPoolExecutor() as ex:
+        current = list(ex.map(_try_compute_file_hash, [path for path, _ in to_hash]))
+
+    changed: dict[str, str | None] = {}
+    refreshed: list[tuple[str, str]] = []
+    for (path, doc_id), current_hash in zip(to_hash, current):
+        stored_hash = stored.get(doc_id, {}).get("hash")
+        if current_hash is None:
+            changed[path] = None  # Assume changed if we can't hash
+        elif stored_hash is None:
+            logger.info("New file (no stored hash): %s", path)
+            changed[path] = current_hash
+        elif current_hash != stored_hash:
+            logger.info("File changed: %s", path)
+            changed[path] = current_hash
+        else:
+            logger.info("File unchanged: %s", path)
+            refreshed.append((path, current_hash))
+
+    # Same content, new stat: refresh so these aren't re-hashed next time
+    store_file_hashes(client, refreshed, collection_name)
+
+    return changed
+
+
 def remove_file_hashes(
     client: chromadb.ClientAPI,
     file_paths: list[str],
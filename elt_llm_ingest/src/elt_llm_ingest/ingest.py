@@ -2,11 +2,22 @@
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import logging
+import multiprocessing
+import pickle
+import re
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import nullcontext
 from dataclasses import dataclass, field
+from functools import cached_property, lru_cache
 import os
+from itertools import chain, islice, repeat
 from pathlib import Path
-from typing import Any, List, Tuple
+from typing import Any, Iterable, Iterator, List, Tuple
 
 from llama_index.core import (
     Document,
@@ -15,12 +26,19 @@ from llama_index.core import (
     StorageContext,
     VectorStoreIndex,
 )
-from llama_index.core.ingestion import IngestionPipeline
-from llama_index.core.node_parser import SentenceSplitter
+from llama_index.core.base.embeddings.base import BaseEmbedding
+from llama_index.core.readers.base import BaseReader
+from llama_index.core.readers.file.base import default_file_metadata_func
+from llama_index.core.schema import BaseNode, MetadataMode, NodeRelationship
+from llama_index.core.node_parser import NodeParser, SentenceSplitter
 from llama_index.core.storage.docstore import SimpleDocumentStore
+from llama_index.core.vector_stores.utils import node_to_metadata_dict
+from llama_index.vector_stores.chroma import ChromaVectorStore
 
 import chromadb
-from elt_llm_core.config import ChunkingConfig, RagConfig
+import numpy as np
+import yaml
+from elt_llm_core.config import YAML_LOADER, ChunkingConfig, RagConfig
 from elt_llm_core.models import create_embedding_model
 from elt_llm_core.vector_store import (
     ChromaConfig,
@@ -28,17 +46,46 @@ from elt_llm_core.vector_store import (
     create_storage_context,
     delete_collection,
     get_docstore_path,
+    get_or_create_collection,
+    save_docstore_nodes,
 )
 from elt_llm_ingest.file_hash import (
     FILE_HASH_COLLECTION,
+    compute_file_hash,
+    filter_changed_files,
     get_collection_file_count,
-    is_file_changed,
-    store_file_hash,
+    store_file_hashes,
 )
 from elt_llm_ingest.preprocessor import PreprocessorConfig, preprocess_file
 
 logger = logging.getLogger(__name__)
 
+# Documents chunked, embedded and written per step in build_index
+DOCUMENT_BATCH_SIZE = 32
+
+# Extraction noise removed before chunking (see _clean_text)
+_INVISIBLE_RE = re.compile("[\u200b\u200c\u200d\ufeff\u00ad]")
+_INNER_SPACE_RE = re.compile(r"(?<=\S)[ \t\u00a0]{2,}")
+_TRAILING_SPACE_RE = re.compile(r"[ \t]+$", re.MULTILINE)
+_BLANK_LINES_RE = re.compile(r"\n{3,}")
+
+# Reader per file suffix, created on first use and reused for every file this
+# process loads (a SimpleDirectoryReader builds fresh ones on each call)
+_FILE_EXTRACTOR: dict[str, BaseReader] = {}
+
+# File-system metadata SimpleDirectoryReader hides from embedding/LLM text
+_FILE_INFO_KEYS = (
+    "file_name",
+    "file_type",
+    "file_size",
+    "creation_date",
+    "last_modified_date",
+    "last_accessed_date",
+)
+
+# Per-collection chunk cache directory, under the collection's docstore path
+CHUNK_CACHE_DIR = "chunk_cache"
+
 
 @dataclass
 class IngestConfig:
@@ -70,6 +117,125 @@ class IngestConfig:
     force: bool = False
     preprocessor: PreprocessorConfig | None = None
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any], **overrides: Any) -> "IngestConfig":
+        """Create IngestConfig from a parsed ingestion config dictionary.
+
+        The shape of the document is validated up front so that a typo in the
+        YAML is reported here rather than surfacing deep inside ingestion.
+
+        Args:
+            data: Dictionary with the ingestion configuration.
+            **overrides: Field values that take precedence over ``data``
+                (e.g. ``collection_name`` from the CLI, ``rebuild``, ``force``).
+                ``None`` values are ignored.
+
+        Returns:
+            IngestConfig instance.
+
+        Raises:
+            ValueError: If the configuration is malformed.
+        """
+        if not isinstance(data, dict):
+            raise ValueError("Ingestion configuration must be a YAML dictionary")
+
+        overrides = {k: v for k, v in overrides.items() if v is not None}
+        collection_prefix = data.get("collection_prefix")
+        if collection_prefix and data.get("collection_name"):
+            raise ValueError("Ingestion config must not set both 'collection_prefix' and 'collection_name'")
+        if collection_prefix and "collection_name" in overrides:
+            raise ValueError(
+                "A collection name cannot override a 'collection_prefix' config "
+                "(split ingestion writes one collection per section)"
+            )
+        collection_name = overrides.pop("collection_name", None) or data.get("collection_name")
+        if not collection_name and not collection_prefix:
+            raise ValueError("Ingestion config must set either 'collection_name' or 'collection_prefix'")
+
+        file_paths = data.get("file_paths") or []
+        if not isinstance(file_paths, list) or not all(isinstance(p, str) for p in file_paths):
+            raise ValueError("'file_paths' must be a list of path strings")
+
+        metadata = data.get("metadata")
+        if metadata is not None and not isinstance(metadata, dict):
+            raise ValueError("'metadata' must be a mapping")
+
+        preprocessor = None
+        if "preprocessor" in data:
+            preprocessor = PreprocessorConfig.from_dict(data["preprocessor"])
+            # Propagate collection_prefix into the preprocessor so split mode works
+            if collection_prefix and preprocessor.collection_prefix is None:
+                preprocessor.collection_prefix = collection_prefix
+
+        fields: dict[str, Any] = {
+            "collection_name": collection_name,
+            "collection_prefix": collection_prefix,
+            "file_paths": file_paths,
+            "metadata": metadata,
+            "rebuild": data.get("rebuild", True),
+            "preprocessor": preprocessor,
+        }
+        fields.update(overrides)
+        return cls(**fields)
+
+
+def _clean_text(text: str) -> str:
+    """Strip extraction noise that only inflates token and chunk counts.
+
+    Drops zero-width characters and soft hyphens, turns form feeds into line
+    breaks, collapses runs of spaces inside a line (leading indentation is
+    kept), trims line ends and limits blank lines to one.
+    """
+    text = _INVISIBLE_RE.sub("", text).replace("\f", "\n")
+    text = _INNER_SPACE_RE.sub(" ", text)
+    text = _TRAILING_SPACE_RE.sub("", text)
+    return _BLANK_LINES_RE.sub("\n\n", text).strip()
+
+
+def _process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Create a process pool whose workers do not fork the calling process.
+
+    By the time a pool starts, the Chroma client has started threads, and the
+    pipeline may itself run on a web-server worker thread; forking then can
+    copy locks held by other threads. ``forkserver`` (``spawn`` where it is
+    unavailable) starts workers from a clean interpreter instead.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    method = "forkserver" if "forkserver" in methods else "spawn"
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method))
+
+
+def _load_one(file_path: str) -> list[Document]:
+    """Read one file, clean its text and sanitize its metadata for ChromaDB.
+
+    Module-level so it can run in a worker process.
+    """
+    # Same readers and metadata as SimpleDirectoryReader(input_files=[...]),
+    # without constructing a directory reader per file
+    docs = SimpleDirectoryReader.load_file(
+        input_file=Path(file_path),
+        file_metadata=default_file_metadata_func,
+        file_extractor=_FILE_EXTRACTOR,
+    )
+    for doc in docs:
+        doc.excluded_embed_metadata_keys.extend(_FILE_INFO_KEYS)
+        doc.excluded_llm_metadata_keys.extend(_FILE_INFO_KEYS)
+        doc.set_content(_clean_text(doc.text))
+
+        # Sanitize metadata: Remove complex types that ChromaDB rejects
+        if "extraction_errors" in doc.metadata:
+            del doc.metadata["extraction_errors"]
+
+        # Keep only supported types (str, int, float, bool, None)
+        safe_metadata = {}
+        for k, v in doc.metadata.items():
+            if isinstance(v, (str, int, float, bool, type(None))):
+                safe_metadata[k] = v
+            else:
+                logger.warning("Dropping unsupported metadata field '%s' type %s", k, type(v))
+        doc.metadata = safe_metadata
+    return docs
+
 
 def load_documents(
     file_paths: list[str],
@@ -79,7 +245,35 @@ def load_documents(
     force: bool = False,
     preprocessor: PreprocessorConfig | None = None,
 ) -> list[Document]:
-    """Load documents from file paths.
+    """Load documents from file paths into a list.
+
+    See :func:`iter_documents` for the arguments; this collects its output.
+
+    Returns:
+        List of LlamaIndex Document objects.
+    """
+    return list(
+        iter_documents(
+            file_paths,
+            metadata=metadata,
+            chroma_client=chroma_client,
+            collection_name=collection_name,
+            force=force,
+            preprocessor=preprocessor,
+        )
+    )
+
+
+def iter_documents(
+    file_paths: list[str],
+    metadata: dict[str, Any] | None = None,
+    chroma_client: chromadb.ClientAPI | None = None,
+    collection_name: str | None = None,
+    force: bool = False,
+    preprocessor: PreprocessorConfig | None = None,
+    process_pool: ProcessPoolExecutor | None = None,
+) -> Iterator[Document]:
+    """Load documents from file paths, yielding them file by file.
 
     Supports multiple file formats via LlamaIndex readers:
     - PDF (.pdf)
@@ -89,6 +283,9 @@ def load_documents(
     - And more...
 
     If a preprocessor is configured, files are preprocessed before loading.
+    Several files are parsed concurrently in a process pool; hashes are
+    recorded in this process so the Chroma client never leaves it, and are
+    stored once the generator is exhausted.
 
     Args:
         file_paths: List of file paths to load.
@@ -97,14 +294,19 @@ def load_documents(
         collection_name: Optional collection name for hash tracking.
         force: If True, skip hash checking and load all files.
         preprocessor: Optional preprocessor configuration.
+        process_pool: Pool to parse files in (e.g. one shared with
+            :func:`build_index`). A pool is created for this call if not
+            provided.
 
-    Returns:
-        List of LlamaIndex Document objects.
+    Yields:
+        LlamaIndex Document objects, in file order.
     """
     logger.info("Loading %d documents", len(file_paths))
 
-    documents: list[Document] = []
+    document_count = 0
     files_to_process: list[str] = []
+    # Hashes already computed by the change check, keyed by expanded path
+    known_hashes: dict[str, str | None] = {}
 
     # Preprocess files if configured
     all_files_to_check = []
@@ -118,99 +320,335 @@ def load_documents(
 
     # Filter files by change detection if not in force mode
     if chroma_client and collection_name and not force:
+        # Stat each file once; the result also feeds the mtime/size fast path
+        env_dir = os.environ.get("RAG_DOCS_DIR")
+        docs_dir = Path(env_dir).expanduser() if env_dir else None
+        candidates: list[str] = []
+        candidate_stats: list[os.stat_result] = []
         for file_path in all_files_to_check:
             path = Path(file_path).expanduser()
-            if not path.exists():
-                env_dir = os.environ.get("RAG_DOCS_DIR")
-                if env_dir:
-                    alt_path = Path(env_dir).expanduser() / Path(file_path).name
-                    if alt_path.exists():
-                        path = alt_path
-                    else:
-                        logger.warning("File not found at %s and override %s", path, alt_path)
-                        continue
-                else:
+            try:
+                st = path.stat()
+            except OSError:
+                if docs_dir is None:
                     logger.warning("File not found: %s", path)
                     continue
+                alt_path = docs_dir / path.name
+                try:
+                    st = alt_path.stat()
+                except OSError:
+                    logger.warning("File not found at %s and override %s", path, alt_path)
+                    continue
+                path = alt_path
 
-            if is_file_changed(chroma_client, str(path), collection_name):
-                files_to_process.append(str(path))
-            else:
+            candidates.append(str(path))
+            candidate_stats.append(st)
+
+        # One stored-hash lookup for all candidates instead of one per file;
+        # the hashes it computed are stored after loading, not recomputed
+        known_hashes = filter_changed_files(
+            chroma_client, candidates, collection_name, file_stats=candidate_stats
+        )
+        files_to_process = list(known_hashes)
+        for path in candidates:
+            if path not in known_hashes:
                 logger.info("Skipping unchanged file: %s", path)
     else:
         files_to_process = [str(Path(fp).expanduser()) for fp in all_files_to_check]
 
     if not files_to_process:
         logger.info("No files to process (all unchanged)")
-        return documents
+        return
 
     logger.info("Processing %d/%d files (changed or new)", len(files_to_process), len(all_files_to_check))
 
-    for file_path in files_to_process:
-        path = Path(file_path)
-        logger.debug("Loading document: %s", path)
+    # Parsing is CPU-bound per file: fan out across processes (a single file
+    # is read in-process), consuming results in input order
+    max_workers = min(os.cpu_count() or 1, len(files_to_process))
+    own_pool = process_pool is None and len(files_to_process) > 1
+    if own_pool:
+        executor = _process_pool(max_workers)
+    else:
+        executor = process_pool if len(files_to_process) > 1 else None
+    # At most this many files are parsed ahead of the consumer; each future
+    # is dropped once its documents are yielded, so memory stays bounded
+    window = 2 * max_workers
+
+    # Hashes of successfully loaded files, stored in one batch at the end
+    loaded_hashes: list[tuple[str, str]] = []
+    track_hashes = bool(chroma_client and collection_name)
+    add_hash = loaded_hashes.append
+    with executor if own_pool else nullcontext():
+        pending: deque[Future[list[Document]]] = deque(
+            executor.submit(_load_one, file_path)
+            for file_path in files_to_process[:window]
+        ) if executor else deque()
+        # file_path is already an expanded path string
+        for i, file_path in enumerate(files_to_process):
+            logger.debug("Loading document: %s", file_path)
+
+            try:
+                if executor:
+                    future = pending.popleft()
+                    if i + window < len(files_to_process):
+                        pending.append(executor.submit(_load_one, files_to_process[i + window]))
+                    docs = future.result()
+                    del future
+                else:
+                    docs = _load_one(file_path)
+                for doc in docs:
+                    doc_metadata = doc.metadata
+                    if metadata:
+                        doc_metadata.update(metadata)
+                    doc_metadata["source_file"] = file_path
+                logger.info("Loaded document: %s (%d chars)", file_path, len(doc.text or ""))
+
+                # Record hash after successful load (hashed here only when the
+                # change check did not already, e.g. in force mode)
+                if track_hashes:
+                    add_hash((file_path, known_hashes.get(file_path) or compute_file_hash(file_path)))
+            except Exception as e:
+                logger.error("Failed to load %s: %s", file_path, e)
+                continue
+
+            document_count += len(docs)
+            yield from docs
+            del docs
+
+    if track_hashes:
+        store_file_hashes(chroma_client, loaded_hashes, collection_name)
 
+    logger.info("Loaded %d documents total", document_count)
+
+
+@lru_cache(maxsize=8)
+def _get_splitter(
+    strategy: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    table_chunk_size: int,
+    table_detection_threshold: float,
+) -> NodeParser:
+    """Return a shared splitter per chunking setup.
+
+    Splitters hold no per-document state, so repeated builds (split-mode
+    sections, service loops) reuse one instead of rebuilding its tokenizer
+    and regexes each time.
+    """
+    from elt_llm_ingest.chunking import create_splitter
+
+    return create_splitter(
+        strategy=strategy,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        table_chunk_size=table_chunk_size,
+        table_detection_threshold=table_detection_threshold,
+    )
+
+
+def _splitter_args(chunking: ChunkingConfig) -> tuple[str, int, int, int, float]:
+    """The :func:`_get_splitter` arguments for a chunking setup."""
+    return (
+        chunking.strategy,
+        chunking.chunk_size,
+        chunking.chunk_overlap,
+        getattr(chunking, "table_chunk_size", 1024),
+        getattr(chunking, "table_detection_threshold", 0.3),
+    )
+
+
+def _batched(items: Iterable[Document], size: int) -> Iterator[list[Document]]:
+    """Yield successive lists of up to ``size`` items."""
+    it = iter(items)
+    while batch := list(islice(it, size)):
+        yield batch
+
+
+def _split_document(splitter_args: tuple, document: Document) -> list[BaseNode]:
+    """Chunk one document (module-level so it can run in a worker process).
+
+    Takes the splitter's settings rather than the splitter, so each worker
+    builds it once through the :func:`_get_splitter` cache instead of
+    unpickling a copy with every document.
+    """
+    return _get_splitter(*splitter_args).get_nodes_from_documents([document])
+
+
+def _split_documents(
+    splitter_args: tuple,
+    documents: list[Document],
+    pool: ProcessPoolExecutor,
+) -> list[list[BaseNode]]:
+    """Chunk documents across the pool; one node list per document, in order."""
+    if len(documents) == 1:
+        return [_split_document(splitter_args, documents[0])]
+    return list(pool.map(_split_document, repeat(splitter_args, len(documents)), documents))
+
+
+def _chunk_cache_key(chunking: ChunkingConfig, document: Document) -> str:
+    """Content address for a document's chunks.
+
+    Covers everything the split depends on: the chunking settings, the text,
+    and the embed/LLM metadata strings the splitter reserves room for in each
+    chunk. Metadata excluded from both (file dates, sizes) is left out, so
+    re-reading an unchanged file still hits.
+    """
+    h = hashlib.sha256(repr(chunking).encode())
+    h.update(
+        json.dumps(
+            [
+                document.get_metadata_str(MetadataMode.EMBED),
+                document.get_metadata_str(MetadataMode.LLM),
+            ]
+        ).encode()
+    )
+    h.update(document.text.encode())
+    return h.hexdigest()
+
+
+def _split_documents_cached(
+    splitter_args: tuple,
+    documents: list[Document],
+    pool: ProcessPoolExecutor,
+    chunking: ChunkingConfig,
+    cache_dir: Path,
+    used_keys: set[str],
+) -> list[BaseNode]:
+    """Chunk documents, reusing cached nodes for content seen on a previous run.
+
+    Nodes are pickled per document under ``cache_dir``; only cache misses are
+    sent to the split pool. Cached nodes are re-pointed at the current
+    document, whose ID changes on every load, and take its current metadata
+    (the key ignores fields such as file dates).
+    """
+    keys = [_chunk_cache_key(chunking, doc) for doc in documents]
+    used_keys.update(keys)
+
+    node_lists: list[list[BaseNode] | None] = []
+    for doc, key in zip(documents, keys):
         try:
-            reader = SimpleDirectoryReader(input_files=[str(path)])
-            docs = reader.load_data()
-            for doc in docs:
-                # Sanitize metadata: Remove complex types that ChromaDB rejects
-                if "extraction_errors" in doc.metadata:
-                    del doc.metadata["extraction_errors"]
-                
-                # Keep only supported types (str, int, float, bool, None)
-                safe_metadata = {}
-                for k, v in doc.metadata.items():
-                    if isinstance(v, (str, int, float, bool, type(None))):
-                        safe_metadata[k] = v
-                    else:
-                        logger.warning("Dropping unsupported metadata field '%s' type %s", k, type(v))
-                doc.metadata = safe_metadata
-
-                if metadata:
-                    doc.metadata.update(metadata)
-                doc.metadata["source_file"] = str(path)
-            documents.extend(docs)
-            logger.info("Loaded document: %s (%d chars)", path, len(doc.text or ""))
-
-            # Store hash after successful load
-            if chroma_client and collection_name:
-                store_file_hash(chroma_client, str(path), collection_name)
+            with open(cache_dir / f"{key}.pkl", "rb") as f:
+                nodes = pickle.load(f)
+        except FileNotFoundError:
+            node_lists.append(None)
+            continue
         except Exception as e:
-            logger.error("Failed to load %s: %s", path, e)
+            logger.warning("Ignoring unreadable chunk cache entry %s: %s", key, e)
+            node_lists.append(None)
+            continue
+        source = doc.as_related_node_info()
+        for node in nodes:
+            node.metadata.update(doc.metadata)
+            if NodeRelationship.SOURCE in node.relationships:
+                node.relationships[NodeRelationship.SOURCE] = source
+        node_lists.append(nodes)
+
+    misses = [i for i, nodes in enumerate(node_lists) if nodes is None]
+    if misses:
+        split = _split_documents(splitter_args, [documents[i] for i in misses], pool)
+        for i, nodes in zip(misses, split):
+            node_lists[i] = nodes
+            with open(cache_dir / f"{keys[i]}.pkl", "wb") as f:
+                pickle.dump(nodes, f, protocol=pickle.HIGHEST_PROTOCOL)
+    logger.debug("Chunk cache: %d/%d documents reused", len(documents) - len(misses), len(documents))
+
+    return [node for nodes in node_lists for node in nodes]
+
+
+def _prune_chunk_cache(cache_dir: Path, used_keys: set[str]) -> None:
+    """Drop cache entries not used by the current run."""
+    for entry in cache_dir.glob("*.pkl"):
+        if entry.stem not in used_keys:
+            entry.unlink(missing_ok=True)
 
-    logger.info("Loaded %d documents total", len(documents))
-    return documents
+
+def _embed_texts(embed_model: BaseEmbedding, texts: list[str]) -> list[list[float]]:
+    """Embed texts through the async batch API, several requests in flight.
+
+    ``asyncio.run`` cannot start inside a running event loop (a notebook or
+    an async app), so callers already on one get the sync batch API instead.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(embed_model.aget_text_embedding_batch(texts, show_progress=True))
+    return embed_model.get_text_embedding_batch(texts, show_progress=True)
+
+
+def _node_metadata(node: BaseNode) -> dict[str, Any]:
+    """Flat Chroma metadata for a node, as ChromaVectorStore.add() builds it.
+
+    Chroma rejects None values, so they are stored as "" (document metadata
+    keeps None through sanitization).
+    """
+    metadata = node_to_metadata_dict(node, remove_text=True, flat_metadata=True)
+    for key, value in metadata.items():
+        if value is None:
+            metadata[key] = ""
+    return metadata
+
+
+def _add_to_collection(
+    collection: chromadb.Collection,
+    nodes: list[BaseNode],
+    batch_size: int,
+) -> None:
+    """Write embedded nodes straight to a Chroma collection.
+
+    Uses the largest batches the client accepts rather than the index's
+    per-batch inserts. Records match what ChromaVectorStore.add() stores,
+    so the collection reads back through LlamaIndex as before.
+    """
+    for start in range(0, len(nodes), batch_size):
+        batch = nodes[start:start + batch_size]
+        collection.add(
+            ids=[node.node_id for node in batch],
+            embeddings=np.asarray([node.embedding for node in batch], dtype=np.float32),
+            documents=[node.get_content(metadata_mode=MetadataMode.NONE) for node in batch],
+            metadatas=[_node_metadata(node) for node in batch],
+        )
 
 
 def build_index(
-    documents: list[Document],
+    documents: Iterable[Document],
     rag_config: RagConfig,
     collection_name: str,
     rebuild: bool = True,
     chunking_override: ChunkingConfig | None = None,
+    chroma_client: chromadb.ClientAPI | None = None,
+    process_pool: ProcessPoolExecutor | None = None,
 ) -> tuple[VectorStoreIndex, int]:
     """Build a vector index from documents.
 
+    Documents are consumed in batches of ``DOCUMENT_BATCH_SIZE``: each batch
+    is chunked, embedded and written to Chroma before the next is read, so
+    a generator (see :func:`iter_documents`) never has the whole corpus in
+    memory at once.
+
     Args:
-        documents: List of Document objects to index.
+        documents: Document objects to index (any iterable).
         rag_config: RAG configuration.
         collection_name: Name of the Chroma collection.
         rebuild: Whether to rebuild the collection.
+        chunking_override: Chunking settings to use instead of ``rag_config``'s.
+        chroma_client: Existing ChromaDB client to reuse (created from
+            ``rag_config`` if not provided).
+        process_pool: Pool to split documents in. Pass the pool that loads
+            ``documents`` so the two stages share one set of workers; a pool
+            is created for this call if not provided.
 
     Returns:
         Tuple of (VectorStoreIndex, node_count) where node_count is the number
         of chunks stored.
     """
     logger.info(
-        "Building index from %d documents (collection=%s, rebuild=%s)",
-        len(documents),
+        "Building index (collection=%s, rebuild=%s)",
         collection_name,
         rebuild,
     )
 
-    # Create Chroma client
-    chroma_client = create_chroma_client(rag_config.chroma)
+    if chroma_client is None:
+        chroma_client = create_chroma_client(rag_config.chroma)
 
     # Delete existing collection if rebuild
     if rebuild:
@@ -220,50 +658,84 @@ def build_index(
     embed_model = create_embedding_model(rag_config.ollama)
     Settings.embed_model = embed_model
 
-    # Step 1: Chunk documents into nodes.
     # NOTE: VectorStoreIndex.from_documents() with ChromaDB skips the docstore
-    # (ChromaDB is the authoritative node store). We run the pipeline explicitly
-    # so we have the nodes to save separately for BM25.
+    # (ChromaDB is the authoritative node store). We split explicitly so we
+    # have the nodes to save separately for BM25.
     chunking = chunking_override if chunking_override is not None else rag_config.chunking
     
-    # Use table-aware splitter for FA Handbook to preserve definition table rows
-    from elt_llm_ingest.chunking import create_splitter
-    splitter = create_splitter(
-        strategy=chunking.strategy,
-        chunk_size=chunking.chunk_size,
-        chunk_overlap=chunking.chunk_overlap,
-        table_chunk_size=getattr(chunking, "table_chunk_size", 1024),
-        table_detection_threshold=getattr(chunking, "table_detection_threshold", 0.3),
-    )
-    
-    nodes = IngestionPipeline(transformations=[splitter]).run(
-        documents=documents,
-        show_progress=True,
-    )
-    logger.info("Created %d nodes from %d documents", len(nodes), len(documents))
-
-    # Step 2: Persist nodes to a SimpleDocumentStore for BM25 hybrid search.
-    docstore = SimpleDocumentStore()
-    docstore.add_documents(nodes)
-    docstore_path = get_docstore_path(rag_config.chroma, collection_name)
-    docstore_path.mkdir(parents=True, exist_ok=True)
-    StorageContext.from_defaults(docstore=docstore).persist(persist_dir=str(docstore_path))
-    logger.info("Docstore persisted: %s (%d nodes)", docstore_path, len(nodes))
+    # Use table-aware splitter for FA Handbook to preserve definition table rows.
+    # Built here so a bad strategy fails before any document is read; split
+    # workers build their own from the same arguments.
+    splitter_args = _splitter_args(chunking)
+    _get_splitter(*splitter_args)
 
-    # Step 3: Embed nodes and store vectors in ChromaDB.
-    storage_context = create_storage_context(
+    collection = get_or_create_collection(
         chroma_client,
         collection_name,
         metadata={"description": f"Collection: {collection_name}"},
     )
-    index = VectorStoreIndex(
-        nodes=nodes,
-        storage_context=storage_context,
-        show_progress=True,
-    )
+    add_batch_size = chroma_client.get_max_batch_size()
 
-    logger.info("Index built successfully with %d nodes", len(nodes))
-    return index, len(nodes)
+    # Chunks of previously seen content are reused from the chunk cache
+    docstore_path = get_docstore_path(rag_config.chroma, collection_name)
+    chunk_cache_dir = docstore_path / CHUNK_CACHE_DIR
+    chunk_cache_dir.mkdir(parents=True, exist_ok=True)
+    used_keys: set[str] = set()
+
+    all_nodes: list[BaseNode] = []
+    document_count = 0
+    # Sentence splitting is pure Python and CPU-bound; documents split
+    # independently, so each batch is fanned out over one process pool
+    with (
+        nullcontext(process_pool)
+        if process_pool is not None
+        else _process_pool(min(os.cpu_count() or 1, DOCUMENT_BATCH_SIZE))
+    ) as split_pool:
+        for doc_batch in _batched(documents, DOCUMENT_BATCH_SIZE):
+            document_count += len(doc_batch)
+
+            # Step 1: Chunk documents into nodes.
+            nodes = _split_documents_cached(
+                splitter_args, doc_batch, split_pool, chunking, chunk_cache_dir, used_keys
+            )
+            del doc_batch
+
+            # Step 2: Embed nodes and store vectors in ChromaDB.
+            # Embed through the async batch API so several Ollama requests are
+            # in flight at once.
+            texts = [node.get_content(metadata_mode=MetadataMode.EMBED) for node in nodes]
+            embeddings = _embed_texts(embed_model, texts)
+            for node, embedding in zip(nodes, embeddings):
+                node.embedding = embedding
+            _add_to_collection(collection, nodes, add_batch_size)
+
+            # Vectors now live in Chroma; keep only the text for the docstore
+            for node in nodes:
+                node.embedding = None
+            all_nodes.extend(nodes)
+            logger.info("Indexed %d nodes from %d documents so far", len(all_nodes), document_count)
+
+    logger.info("Created %d nodes from %d documents", len(all_nodes), document_count)
+
+    # Entries not used by this run are dropped so the cache cannot grow
+    # without bound; an append only reloads changed files, so unchanged
+    # files are re-split on the next rebuild.
+    _prune_chunk_cache(chunk_cache_dir, used_keys)
+
+    # Step 3: Persist nodes for BM25 hybrid search: the JSON
+    # SimpleDocumentStore unless disabled in config, plus a binary snapshot.
+    # The snapshot is written last: loaders skip one older than the JSON.
+    if rag_config.chroma.json_docstore:
+        docstore = SimpleDocumentStore()
+        docstore.add_documents(all_nodes)
+        StorageContext.from_defaults(docstore=docstore).persist(persist_dir=str(docstore_path))
+    save_docstore_nodes(docstore_path, all_nodes)
+    logger.info("Docstore persisted: %s (%d nodes)", docstore_path, len(all_nodes))
+
+    index = VectorStoreIndex.from_vector_store(ChromaVectorStore(chroma_collection=collection))
+
+    logger.info("Index built successfully with %d nodes", len(all_nodes))
+    return index, len(all_nodes)
 
 
 def run_split_ingestion(
@@ -356,6 +828,7 @@ def run_split_ingestion(
                 collection_name=collection_name,
                 rebuild=ingest_config.rebuild,
                 chunking_override=ingest_config.chunking_override,
+                chroma_client=chroma_client,
             )
             results.append((collection_name, index, node_count))
             logger.info("Section '%s': %d nodes indexed", collection_name, node_count)
@@ -363,10 +836,47 @@ def run_split_ingestion(
     return results
 
 
+class _ExistingIndex:
+    """Stand-in for the index of a collection that needed no ingestion.
+
+    Behaves like the ``VectorStoreIndex`` (attribute access is forwarded),
+    but the embedding model and index are only created on first use, so
+    no-op runs whose caller ignores the index skip that setup.
+    """
+
+    def __init__(
+        self,
+        chroma_client: chromadb.ClientAPI,
+        collection_name: str,
+        rag_config: RagConfig,
+    ) -> None:
+        self._chroma_client = chroma_client
+        self._collection_name = collection_name
+        self._rag_config = rag_config
+
+    @cached_property
+    def _index(self) -> VectorStoreIndex:
+        Settings.embed_model = create_embedding_model(self._rag_config.ollama)
+        storage_context = create_storage_context(
+            self._chroma_client,
+            self._collection_name,
+            metadata={"description": f"Collection: {self._collection_name}"},
+        )
+        index = VectorStoreIndex.from_vector_store(storage_context.vector_store)
+        logger.info("Loaded existing index with unchanged documents")
+        return index
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_"):
+            # Private/dunder lookups (copy, pickle) must not open the index
+            raise AttributeError(name)
+        return getattr(self._index, name)
+
+
 def run_ingestion(
     ingest_config: IngestConfig,
     rag_config: RagConfig,
-) -> tuple[VectorStoreIndex, int]:
+) -> tuple[VectorStoreIndex | _ExistingIndex, int]:
     """Run the complete ingestion pipeline.
 
     Args:
@@ -374,8 +884,9 @@ def run_ingestion(
         rag_config: RAG configuration.
 
     Returns:
-        Tuple of (VectorStoreIndex, nodes_indexed) where nodes_indexed is 0
-        when all files were unchanged and no rebuild was needed.
+        Tuple of (index, nodes_indexed) where nodes_indexed is 0 when all
+        files were unchanged and no rebuild was needed. In that case the
+        index is an ``_ExistingIndex`` that opens the collection on first use.
 
     Raises:
         ValueError: If no documents were loaded.
@@ -408,45 +919,42 @@ def run_ingestion(
         )
         logger.info("Cleared file hashes for rebuild")
 
-    # Load documents (with hash checking if not force mode)
-    documents = load_documents(
-        file_paths=ingest_config.file_paths,
-        metadata=ingest_config.metadata,
-        chroma_client=chroma_client,
-        collection_name=ingest_config.collection_name,
-        force=ingest_config.force,
-        preprocessor=ingest_config.preprocessor,
-    )
-
-    # If no documents and not rebuilding, all files were unchanged - this is OK
-    if not documents and not ingest_config.rebuild:
-        logger.info("All files unchanged, no ingestion needed")
-        # Return existing index by loading from storage context
-        embed_model = create_embedding_model(rag_config.ollama)
-        Settings.embed_model = embed_model
-        
-        storage_context = create_storage_context(
-            chroma_client,
-            ingest_config.collection_name,
-            metadata={"description": f"Collection: {ingest_config.collection_name}"},
+    # Loading and splitting overlap while build_index consumes the stream, so
+    # both share one process pool rather than each starting a full-size one
+    with _process_pool(os.cpu_count() or 1) as process_pool:
+        # Stream documents (with hash checking if not force mode) so
+        # build_index can chunk and embed them batch by batch
+        documents = iter_documents(
+            file_paths=ingest_config.file_paths,
+            metadata=ingest_config.metadata,
+            chroma_client=chroma_client,
+            collection_name=ingest_config.collection_name,
+            force=ingest_config.force,
+            preprocessor=ingest_config.preprocessor,
+            process_pool=process_pool,
         )
-        from llama_index.core import VectorStoreIndex
-        index = VectorStoreIndex.from_vector_store(
-            storage_context.vector_store,
-        )
-        logger.info("Loaded existing index with unchanged documents")
-        return index, 0
 
-    if not documents:
-        raise ValueError("No documents were loaded. Check file paths.")
-
-    # Build index
-    index, node_count = build_index(
-        documents=documents,
-        rag_config=rag_config,
-        collection_name=ingest_config.collection_name,
-        rebuild=ingest_config.rebuild,
-    )
+        first = next(documents, None)
+
+        # If no documents and not rebuilding, all files were unchanged - this is OK
+        if first is None and not ingest_config.rebuild:
+            logger.info("All files unchanged, no ingestion needed")
+            # Existing index, opened only if the caller actually uses it
+            index = _ExistingIndex(chroma_client, ingest_config.collection_name, rag_config)
+            return index, 0
+
+        if first is None:
+            raise ValueError("No documents were loaded. Check file paths.")
+
+        # Build index
+        index, node_count = build_index(
+            documents=chain([first], documents),
+            rag_config=rag_config,
+            collection_name=ingest_config.collection_name,
+            rebuild=ingest_config.rebuild,
+            chroma_client=chroma_client,
+            process_pool=process_pool,
+        )
 
     logger.info("Ingestion pipeline complete")
     return index, node_count
@@ -455,7 +963,7 @@ def run_ingestion(
 def ingest_from_config(
     config_path: str | Path,
     rag_config: RagConfig | None = None,
-) -> VectorStoreIndex:
+) -> VectorStoreIndex | _ExistingIndex:
     """Run ingestion from a configuration file.
 
     Args:
@@ -463,20 +971,19 @@ def ingest_from_config(
         rag_config: Optional RAG config (loads from same path if not provided).
 
     Returns:
-        VectorStoreIndex containing the ingested documents.
+        Index of the ingested documents (an ``_ExistingIndex`` when all files
+        were unchanged, see ``run_ingestion``).
+
+    Raises:
+        ValueError: If the ingestion configuration is malformed.
     """
     config_path = Path(config_path).expanduser()
 
     # Load ingestion config
-    with open(config_path) as f:
-        data = __import__("yaml").safe_load(f)
-
-    ingest_config = IngestConfig(
-        collection_name=data["collection_name"],
-        file_paths=data.get("file_paths", []),
-        metadata=data.get("metadata"),
-        rebuild=data.get("rebuild", True),
-    )
+    with open(config_path, "rb") as f:
+        data = yaml.load(f, Loader=YAML_LOADER)
+
+    ingest_config = IngestConfig.from_dict(data)
 
     # Load RAG config if not provided
     if rag_config is None:
@@ -7,16 +7,22 @@ they are ingested into the RAG system. Preprocessors can transform files
 
 from __future__ import annotations
 
+import importlib
 import logging
+import os
 import re
+import sys
 from abc import ABC, abstractmethod
-from collections import defaultdict
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple
 
 logger = logging.getLogger(__name__)
 
+# LeanIX interface names of the form "<source> to <target>[ LI]"
+_INTERFACE_NAME_RE = re.compile(r"^(.+?)\s+to\s+(.+?)(?:\s+LI)?$", re.IGNORECASE)
+
 
 @dataclass
 class PreprocessorResult:
@@ -45,12 +51,12 @@ class BasePreprocessor(ABC):
     """
     
     @abstractmethod
-    def preprocess(self, input_file: str, output_path: str, **kwargs: Any) -> PreprocessorResult:
+    def preprocess(self, input_file: str | Path, output_path: str | Path, **kwargs: Any) -> PreprocessorResult:
         """Preprocess a file and save the output.
         
         Args:
-            input_file: Path to the input file.
-            output_path: Base path for output file(s).
+            input_file: Path to the input file (``str`` or ``Path``).
+            output_path: Base path for output file(s) (``str`` or ``Path``).
             **kwargs: Additional format-specific arguments.
             
         Returns:
@@ -101,7 +107,7 @@ class LeanIXPreprocessor(BasePreprocessor):
         self.model_name = model_name
         self.org_name = org_name
 
-    def preprocess(self, input_file: str, output_path: str, **kwargs: Any) -> PreprocessorResult:
+    def preprocess(self, input_file: str | Path, output_path: str | Path, **kwargs: Any) -> PreprocessorResult:
         """Preprocess a LeanIX XML file.
 
         Args:
@@ -116,15 +122,19 @@ class LeanIXPreprocessor(BasePreprocessor):
         """
         from .doc_leanix_parser import LeanIXExtractor
 
+        # Resolved once; every output path below is derived from these
         input_path = Path(input_file).expanduser().resolve()
         output_path_obj = Path(output_path).expanduser().resolve()
-        output_path_obj.parent.mkdir(parents=True, exist_ok=True)
+        output_dir = output_path_obj.parent
+        output_stem = output_path_obj.stem
+        output_dir.mkdir(parents=True, exist_ok=True)
+        original_file = os.fspath(input_path)
 
         logger.info("Preprocessing LeanIX file: %s", input_path)
 
         try:
             extractor = LeanIXExtractor(
-                str(input_path),
+                original_file,
                 model_name=self.model_name,
                 org_name=self.org_name,
             )
@@ -139,17 +149,18 @@ class LeanIXPreprocessor(BasePreprocessor):
                 model_json.write_text(extractor.to_model_json(), encoding="utf-8")
 
                 # Flat Markdowns go to the output dir for ChromaDB ingestion
-                output_path_obj.parent.mkdir(parents=True, exist_ok=True)
-                entities_md = output_path_obj.parent / f"{output_path_obj.stem}_entities.md"
-                rels_md = output_path_obj.parent / f"{output_path_obj.stem}_relationships.md"
-                entities_md.write_text(extractor.to_flat_markdown(), encoding="utf-8")
-                rels_md.write_text(extractor.to_flat_relationships_markdown(), encoding="utf-8")
+                entities_md = os.fspath(output_dir / f"{output_stem}_entities.md")
+                rels_md = os.fspath(output_dir / f"{output_stem}_relationships.md")
+                with open(entities_md, "w", encoding="utf-8") as f:
+                    f.write(extractor.to_flat_markdown())
+                with open(rels_md, "w", encoding="utf-8") as f:
+                    f.write(extractor.to_flat_relationships_markdown())
 
                 section_collection_map: Optional[Dict[str, str]] = None
                 if self.collection_prefix:
                     section_collection_map = {
-                        str(entities_md): f"{self.collection_prefix}_entities",
-                        str(rels_md): f"{self.collection_prefix}_relationships",
+                        entities_md: f"{self.collection_prefix}_entities",
+                        rels_md: f"{self.collection_prefix}_relationships",
                     }
 
                 entity_count = len(extractor.to_entities_rows())
@@ -159,8 +170,8 @@ class LeanIXPreprocessor(BasePreprocessor):
                 )
 
                 return PreprocessorResult(
-                    original_file=str(input_path),
-                    output_files=[str(entities_md), str(rels_md)],
+                    original_file=original_file,
+                    output_files=[entities_md, rels_md],
                     success=True,
                     message=(
                         f"JSON: {entity_count} entities, {len(extractor.relationships)} relationships; "
@@ -171,7 +182,7 @@ class LeanIXPreprocessor(BasePreprocessor):
 
             # ── Split mode: one file per domain section + relationships ────────
             if self.output_format == "split":
-                section_dir = output_path_obj.parent / f"{output_path_obj.stem}_sections"
+                section_dir = output_dir / f"{output_stem}_sections"
                 section_file_map = extractor.save_sections(str(section_dir))
 
                 section_collection_map_split: Optional[Dict[str, str]] = None
@@ -187,7 +198,7 @@ class LeanIXPreprocessor(BasePreprocessor):
                     )
 
                 return PreprocessorResult(
-                    original_file=str(input_path),
+                    original_file=original_file,
                     output_files=list(section_file_map.values()),
                     success=True,
                     message=(
@@ -200,23 +211,24 @@ class LeanIXPreprocessor(BasePreprocessor):
 
             # ── Standard single-file modes (markdown / json / both) ───────────
             output_files: List[str] = []
+            # Output path without its suffix, as a plain string
+            output_base = os.fspath(output_dir / output_stem)
 
             if self.output_format in ("markdown", "md", "both"):
-                md_path = output_path_obj.with_suffix(".md")
+                md_path = f"{output_base}.md"
                 with open(md_path, "w", encoding="utf-8") as f:
                     f.write(extractor.to_markdown())
-                output_files.append(str(md_path))
+                output_files.append(md_path)
                 logger.info("Generated Markdown: %s", md_path)
 
             if self.output_format in ("json", "both"):
-                json_path = output_path_obj.with_suffix(".json")
-                with open(json_path, "w", encoding="utf-8") as f:
-                    f.write(extractor.to_json())
-                output_files.append(str(json_path))
+                json_path = f"{output_base}.json"
+                extractor.write_json(json_path)
+                output_files.append(json_path)
                 logger.info("Generated JSON: %s", json_path)
 
             return PreprocessorResult(
-                original_file=str(input_path),
+                original_file=original_file,
                 output_files=output_files,
                 success=True,
                 message=(
@@ -228,13 +240,25 @@ class LeanIXPreprocessor(BasePreprocessor):
         except Exception as e:
             logger.error("Failed to preprocess LeanIX file: %s", e)
             return PreprocessorResult(
-                original_file=str(input_path),
+                original_file=original_file,
                 output_files=[],
                 success=False,
                 message=str(e),
             )
 
 
+class _InventoryRow(NamedTuple):
+    """One LeanIX inventory export row: the only columns read from the sheet."""
+
+    id: Any
+    type: Any
+    name: Any
+    displayName: Any
+    description: Any
+    level: Any
+    lxState: Any
+
+
 class LeanIXInventoryPreprocessor(BasePreprocessor):
     """Preprocessor for the LeanIX full-inventory Excel export.
 
@@ -273,6 +297,13 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
         "Objective":         ("objective",    "Objective Inventory"),
     }
 
+    # Types in output (alphabetical) order, and each type's row bucket
+    _TYPE_ORDER: Tuple[str, ...] = tuple(sorted(_TYPE_MAP))
+    _TYPE_INDEX: Dict[str, int] = {t: i for i, t in enumerate(_TYPE_ORDER)}
+
+    # Columns with a handful of distinct values
+    _INTERNED_COLUMNS = frozenset({"type", "level", "lxState"})
+
     def __init__(
         self,
         output_format: str = "split",
@@ -283,59 +314,65 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
         self.collection_prefix = collection_prefix or "leanix_inv"
         self.org_name = org_name
 
-    def preprocess(self, input_file: str, output_path: str, **kwargs: Any) -> PreprocessorResult:
+    def preprocess(self, input_file: str | Path, output_path: str | Path, **kwargs: Any) -> PreprocessorResult:
         input_path = Path(input_file).expanduser().resolve()
         output_path_obj = Path(output_path).expanduser().resolve()
         section_dir = output_path_obj.parent / f"{output_path_obj.stem}_sections"
         section_dir.mkdir(parents=True, exist_ok=True)
+        original_file = os.fspath(input_path)
 
         logger.info("Preprocessing LeanIX inventory Excel: %s", input_path)
 
         try:
-            rows = self._read_excel(input_path)
-            logger.info("Read %d rows from Excel", len(rows))
-
-            # Group by type
-            by_type: Dict[str, List[dict]] = defaultdict(list)
-            for row in rows:
-                fs_type = row.get("type", "Unknown")
-                if fs_type in self._TYPE_MAP:
-                    by_type[fs_type].append(row)
+            # One streaming pass: rows are grouped by type and indexed for the
+            # JSON lookup as they are read, never held as a separate list.
+            # _inventory.json (written next to source Excel) is keyed by
+            # fact_sheet_id so consumers can do O(1) lookup:
+            #   inventory[entity.fact_sheet_id] → {name, type, description, level, status}
+            buckets: List[List[_InventoryRow]] = [[] for _ in self._TYPE_ORDER]
+            type_index = self._TYPE_INDEX.get
+            fact_sheets: Dict[str, dict] = {}
+            row_count = 0
+            for row in self._iter_excel(input_path):
+                row_count += 1
+                idx = type_index(row.type)
+                if idx is not None:
+                    buckets[idx].append(row)
+
+                fsid = str(row.id or "").strip()
+                if fsid:
+                    fact_sheets[fsid] = {
+                        "id": fsid,
+                        "type": str(row.type or ""),
+                        "name": str(row.name or row.displayName or ""),
+                        "description": str(row.description or "").strip(),
+                        "level": str(row.level or ""),
+                        "status": str(row.lxState or ""),
+                    }
+            logger.info("Read %d rows from Excel", row_count)
 
             section_collection_map: Dict[str, str] = {}
             output_files: List[str] = []
             total = 0
 
-            for fs_type, type_rows in sorted(by_type.items()):
+            for fs_type, type_rows in zip(self._TYPE_ORDER, buckets):
+                if not type_rows:
+                    continue
                 suffix, label = self._TYPE_MAP[fs_type]
                 collection_name = f"{self.collection_prefix}_{suffix}"
 
-                md_content = self._type_to_markdown(fs_type, label, type_rows)
                 out_file = section_dir / f"{suffix}.md"
-                out_file.write_text(md_content, encoding="utf-8")
+                # Rows stream out through a 1 MiB buffer as they are rendered
+                with open(out_file, "w", encoding="utf-8", buffering=1 << 20) as f:
+                    f.writelines(self._iter_type_markdown(fs_type, label, type_rows))
 
-                section_collection_map[str(out_file)] = collection_name
-                output_files.append(str(out_file))
+                out_file_str = os.fspath(out_file)
+                section_collection_map[out_file_str] = collection_name
+                output_files.append(out_file_str)
                 total += len(type_rows)
                 logger.info("  %s → %s (%d rows)", out_file.name, collection_name, len(type_rows))
 
-            # Write _inventory.json next to source Excel for direct consumer lookup.
-            # Keyed by fact_sheet_id so consumers can do O(1) lookup:
-            #   inventory[entity.fact_sheet_id] → {name, type, description, level, status}
             import json as _json
-            fact_sheets: Dict[str, dict] = {}
-            for row in rows:
-                fsid = str(row.get("id") or "").strip()
-                if not fsid:
-                    continue
-                fact_sheets[fsid] = {
-                    "id": fsid,
-                    "type": str(row.get("type") or ""),
-                    "name": str(row.get("name") or row.get("displayName") or ""),
-                    "description": str(row.get("description") or "").strip(),
-                    "level": str(row.get("level") or ""),
-                    "status": str(row.get("lxState") or ""),
-                }
             inventory_json = input_path.parent / f"{input_path.stem}_inventory.json"
             inventory_json.write_text(
                 _json.dumps(
@@ -355,7 +392,7 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
             logger.info("Inventory JSON written: %s (%d fact sheets)", inventory_json.name, len(fact_sheets))
 
             return PreprocessorResult(
-                original_file=str(input_path),
+                original_file=original_file,
                 output_files=output_files,
                 success=True,
                 message=(
@@ -369,7 +406,7 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
         except Exception as e:
             logger.error("Failed to preprocess LeanIX inventory Excel: %s", e)
             return PreprocessorResult(
-                original_file=str(input_path),
+                original_file=original_file,
                 output_files=[],
                 success=False,
                 message=str(e),
@@ -380,12 +417,86 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
     # ------------------------------------------------------------------
 
     @staticmethod
-    def _read_excel(xlsx_path: Path) -> List[dict]:
-        """Read the LeanIX inventory Excel export → list of row dicts.
+    def _iter_excel(xlsx_path: Path) -> Iterator[_InventoryRow]:
+        """Stream the LeanIX inventory Excel export as ``_InventoryRow`` tuples.
+
+        Rows are yielded as they are read, restricted to the ``_InventoryRow``
+        fields; rows with none of those cells filled are skipped.
+        """
+        rows = LeanIXInventoryPreprocessor._iter_sheet_rows(xlsx_path)
+        try:
+            header = next(rows, None)
+            if header is None:
+                return
+            headers = [str(h) if h is not None else f"col_{j}" for j, h in enumerate(header)]
+
+            # Sheet position of each row field (last one wins for duplicate
+            # headers); fields with no column in this export are read as ""
+            header_pos = {h: j for j, h in enumerate(headers)}
+            positions = [header_pos.get(c) for c in _InventoryRow._fields]
+            present = [(k, j) for k, j in enumerate(positions) if j is not None]
+            width = max((j for _, j in present), default=-1) + 1
+            # Low-cardinality columns: share one string object per value
+            intern_pos = [
+                k for k, _ in present
+                if _InventoryRow._fields[k] in LeanIXInventoryPreprocessor._INTERNED_COLUMNS
+            ]
+            missing = [""] * len(positions)
+            make_row = _InventoryRow._make
+            for row in rows:
+                if len(row) < width:
+                    row = (*row, *(None,) * (width - len(row)))
+                values = missing.copy()
+                filled = False
+                for k, j in present:
+                    value = row[j]
+                    if value is not None:
+                        filled = True
+                    values[k] = value
+                if not filled:
+                    continue
+                for k in intern_pos:
+                    value = values[k]
+                    if type(value) is str:
+                        values[k] = sys.intern(value)
+                yield make_row(values)
+        finally:
+            rows.close()
+
+    @staticmethod
+    def _iter_sheet_rows(xlsx_path: Path) -> Iterator[Sequence[Any]]:
+        """Yield the raw cell values of the export sheet, header row first.
 
         Finds the first non-'ReadMe' sheet (the export sheet has a
-        timestamp-based name that changes with every export).
+        timestamp-based name that changes with every export). Uses
+        python-calamine when it is installed, which parses the workbook in
+        Rust; its cells are normalised to what openpyxl returns (empty cells
+        as None, whole numbers as int). Otherwise falls back to openpyxl in
+        read-only mode.
         """
+        try:
+            from python_calamine import CalamineWorkbook  # optional: faster reader
+        except ImportError:
+            CalamineWorkbook = None
+
+        if CalamineWorkbook is not None:
+            wb = CalamineWorkbook.from_path(os.fspath(xlsx_path))
+            try:
+                sheet_name = next(
+                    (name for name in wb.sheet_names if name.lower() != "readme"),
+                    wb.sheet_names[0],
+                )
+                for row in wb.get_sheet_by_name(sheet_name).iter_rows():
+                    yield [
+                        None if value == ""
+                        else int(value) if type(value) is float and value.is_integer()
+                        else value
+                        for value in row
+                    ]
+            finally:
+                wb.close()
+            return
+
         try:
             import openpyxl
         except ImportError as exc:
@@ -395,69 +506,65 @@ class LeanIXInventoryPreprocessor(BasePreprocessor):
             ) from exc
 
         wb = openpyxl.load_workbook(xlsx_path, read_only=True, data_only=True)
-        sheet_name = next(
-            (name for name in wb.sheetnames if name.lower() != "readme"),
-            wb.sheetnames[0],
-        )
-        ws = wb[sheet_name]
-
-        headers: List[str] = []
-        rows: List[dict] = []
-        for i, row in enumerate(ws.iter_rows(values_only=True)):
-            if i == 0:
-                headers = [str(h) if h is not None else f"col_{j}" for j, h in enumerate(row)]
-            else:
-                if any(cell is not None for cell in row):
-                    rows.append(dict(zip(headers, row)))
-        return rows
-
-    def _type_to_markdown(self, fs_type: str, label: str, rows: List[dict]) -> str:
-        """Generate Markdown for a single fact-sheet type."""
-        md: List[str] = []
-        md.append(f"# LeanIX {label}\n\n")
-        md.append(
+        try:
+            sheet_name = next(
+                (name for name in wb.sheetnames if name.lower() != "readme"),
+                wb.sheetnames[0],
+            )
+            yield from wb[sheet_name].iter_rows(values_only=True)
+        finally:
+            # Read-only workbooks keep the file open until closed
+            wb.close()
+
+    def _iter_type_markdown(
+        self, fs_type: str, label: str, rows: List[_InventoryRow]
+    ) -> Iterator[str]:
+        """Generate Markdown for a single fact-sheet type, one chunk per row."""
+        yield f"# LeanIX {label}\n\n"
+        yield (
             f"The {self.org_name} LeanIX inventory contains {len(rows)} {fs_type} fact sheets. "
             "Each entry below includes the name, LeanIX identifier, hierarchy level, "
             "and a description where recorded.\n\n"
         )
-        md.append("---\n\n")
+        yield "---\n\n"
 
+        # One string per row: optional lines are rendered inline
+        is_interface = fs_type == "Interface"
+        parse_endpoints = self._parse_interface_endpoints
         for row in rows:
-            name = (row.get("name") or row.get("displayName") or "Unknown")
-            fsid = row.get("id", "")
-            level = row.get("level", "")
-            lx_state = row.get("lxState", "")
-            description = (row.get("description") or "").strip()
-
-            md.append(f"## {name}\n\n")
-            md.append(f"**LeanIX ID**: `{fsid}`  \n")
-            if level:
-                md.append(f"**Level**: {level}  \n")
-            if lx_state:
-                md.append(f"**Quality State**: {lx_state}  \n")
-
-            if fs_type == "Interface":
-                source, target = self._parse_interface_endpoints(str(name))
+            name = (row.name or row.displayName or "Unknown")
+            fsid = row.id
+            level = row.level
+            lx_state = row.lxState
+            description = (row.description or "").strip()
+
+            level_line = f"**Level**: {level}  \n" if level else ""
+            state_line = f"**Quality State**: {lx_state}  \n" if lx_state else ""
+            flow = ""
+            if is_interface:
+                source, target = parse_endpoints(str(name))
                 if source and target:
-                    md.append(f"**Data flow**: {source} → {target}  \n")
-
-            md.append("\n")
+                    flow = f"**Data flow**: {source} → {target}  \n"
 
             if description:
                 if len(description) > 800:
                     description = description[:800] + "…"
-                md.append(f"{description}\n\n")
+                body = f"{description}\n\n"
             else:
-                md.append("_No description recorded in LeanIX._\n\n")
-
-            md.append("---\n\n")
-
-        return "".join(md)
+                body = "_No description recorded in LeanIX._\n\n"
+
+            yield (
+                f"## {name}\n\n"
+                f"**LeanIX ID**: `{fsid}`  \n"
+                f"{level_line}{state_line}{flow}\n"
+                f"{body}"
+                "---\n\n"
+            )
 
     @staticmethod
     def _parse_interface_endpoints(name: str) -> Tuple[Optional[str], Optional[str]]:
         """Try to extract source and target from an interface name like 'A to B'."""
-        match = re.match(r"^(.+?)\s+to\s+(.+?)(?:\s+LI)?$", name, re.IGNORECASE)
+        match = _INTERFACE_NAME_RE.match(name)
         if match:
             return match.group(1).strip(), match.group(2).strip()
         return None, None
@@ -469,7 +576,7 @@ class IdentityPreprocessor(BasePreprocessor):
     Used when no preprocessing is needed.
     """
     
-    def preprocess(self, input_file: str, output_path: str, **kwargs: Any) -> PreprocessorResult:
+    def preprocess(self, input_file: str | Path, output_path: str | Path, **kwargs: Any) -> PreprocessorResult:
         """Return the original file unchanged.
         
         Args:
@@ -481,13 +588,17 @@ class IdentityPreprocessor(BasePreprocessor):
             PreprocessorResult with the original file path.
         """
         return PreprocessorResult(
-            original_file=input_file,
-            output_files=[input_file],
+            original_file=str(input_file),
+            output_files=[str(input_file)],
             success=True,
             message="No preprocessing applied"
         )
 
 
+# Stateless, so one instance serves every disabled config
+_IDENTITY = IdentityPreprocessor()
+
+
 
 @dataclass
 class PreprocessorConfig:
@@ -539,6 +650,12 @@ class PreprocessorConfig:
         )
 
 
+@lru_cache(maxsize=None)
+def _preprocessor_class(module_name: str, class_name: str) -> type[BasePreprocessor]:
+    """Import and return a preprocessor class, once per (module, class)."""
+    return getattr(importlib.import_module(module_name), class_name)
+
+
 def get_preprocessor(config: PreprocessorConfig) -> BasePreprocessor:
     """Factory function to create a preprocessor instance.
     
@@ -553,10 +670,9 @@ def get_preprocessor(config: PreprocessorConfig) -> BasePreprocessor:
         AttributeError: If the preprocessor class doesn't exist.
     """
     if not config.enabled:
-        return IdentityPreprocessor()
+        return _IDENTITY
     
-    module = __import__(config.module, fromlist=[config.class_name])
-    preprocessor_class = getattr(module, config.class_name)
+    preprocessor_class = _preprocessor_class(config.module, config.class_name)
     return preprocessor_class(
         output_format=config.output_format,
         collection_prefix=config.collection_prefix,
@@ -598,8 +714,8 @@ def preprocess_file(
     else:
         output_path = input_path.parent / f"{input_path.stem}{config.output_suffix}"
     
-    # Run preprocessor
-    result = preprocessor.preprocess(str(input_file), str(output_path))
+    # Run preprocessor (preprocessors accept Path objects directly)
+    result = preprocessor.preprocess(input_path, output_path)
     
     if result.success:
         logger.info("Preprocessing successful: %s", result.message)
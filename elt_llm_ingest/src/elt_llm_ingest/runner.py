@@ -20,6 +20,7 @@ import chromadb
 import yaml
 
 from elt_llm_core.config import ChunkingConfig, RagConfig
+from elt_llm_core.vector_store import DOCSTORE_NODES_FILE, load_docstore_nodes
 from elt_llm_ingest.ingest import IngestConfig, run_ingestion
 from elt_llm_ingest.preprocessor import PreprocessorConfig
 
@@ -80,7 +81,13 @@ def list_configs() -> int:
 def _docstore_node_count(persist_dir: Path, collection_name: str) -> int | None:
     """Return the number of nodes in a collection's BM25 docstore, or None if absent."""
     import json
-    ds = persist_dir / "docstores" / collection_name / "docstore.json"
+    ds_dir = persist_dir / "docstores" / collection_name
+    ds = ds_dir / "docstore.json"
+    if (ds_dir / DOCSTORE_NODES_FILE).exists():
+        try:
+            return len(load_docstore_nodes(ds_dir))
+        except Exception:
+            return None
     if not ds.exists():
         return None
     try:
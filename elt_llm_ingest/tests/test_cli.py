@@ -0,0 +1,187 @@
+"""Tests for the ingestion CLI.
+
+Usage:
+    uv run pytest elt_llm_ingest/tests/test_cli.py
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from elt_llm_core.config import RagConfig
+from elt_llm_ingest import cli, ingest
+
+
+@pytest.fixture
+def config_dir(tmp_path) -> Path:
+    (tmp_path / "rag_config.yaml").write_text(
+        f"chroma:\n  persist_dir: {tmp_path / 'chroma'}\n", encoding="utf-8"
+    )
+    (tmp_path / "a.yaml").write_text(
+        "collection_name: shared\nfile_paths:\n  - a.txt\n", encoding="utf-8"
+    )
+    (tmp_path / "b.yaml").write_text(
+        "collection_name: shared\nfile_paths:\n  - b.txt\n", encoding="utf-8"
+    )
+    (tmp_path / "c.yaml").write_text(
+        "collection_name: other\nfile_paths:\n  - c.txt\n", encoding="utf-8"
+    )
+    return tmp_path
+
+
+def _run_cli(monkeypatch, config_dir: Path, *args: str) -> None:
+    monkeypatch.setattr(
+        sys, "argv", ["elt-llm-ingest", "-r", str(config_dir / "rag_config.yaml"), *args]
+    )
+    cli._main()
+
+
+def test_collection_override_rejected_for_several_configs(monkeypatch, config_dir, capsys):
+    """--collection cannot retarget several configs at one collection."""
+    monkeypatch.setattr(cli, "_run_config", lambda *a: pytest.fail("ingestion must not run"))
+    with pytest.raises(SystemExit) as exc:
+        _run_cli(
+            monkeypatch, config_dir,
+            "-c", str(config_dir / "a.yaml"), str(config_dir / "b.yaml"),
+            "--collection", "other",
+        )
+    assert exc.value.code == 1
+    assert "--collection can only be used with a single --config" in capsys.readouterr().out
+
+
+def test_parallel_configs_must_target_different_collections(monkeypatch, config_dir, capsys):
+    """Configs sharing a collection are not ingested concurrently."""
+    monkeypatch.setattr(cli, "_run_parallel", lambda *a: pytest.fail("ingestion must not run"))
+    with pytest.raises(SystemExit) as exc:
+        _run_cli(
+            monkeypatch, config_dir,
+            "-c", str(config_dir / "a.yaml"), str(config_dir / "b.yaml"),
+            "--workers", "2",
+        )
+    assert exc.value.code == 1
+    assert "must target different collections" in capsys.readouterr().out
+
+
+def test_list_does_not_preload_ingest(monkeypatch, config_dir, capsys):
+    """--list exits without starting the background ingest import."""
+    monkeypatch.setattr(cli, "_preload_ingest", lambda: pytest.fail("preload must not start"))
+    _run_cli(monkeypatch, config_dir, "--list")
+    assert "Available ingestion configs" in capsys.readouterr().out
+
+
+def test_preload_joined_before_config_error_exit(monkeypatch, config_dir):
+    """An early exit waits for the background import to finish."""
+    finished = []
+
+    def slow_preload():
+        time.sleep(0.2)
+        finished.append(True)
+
+    monkeypatch.setattr(cli, "_preload_ingest", slow_preload)
+    monkeypatch.setattr(
+        sys, "argv",
+        ["elt-llm-ingest", "-r", str(config_dir / "missing.yaml"), "-c", str(config_dir / "a.yaml")],
+    )
+    with pytest.raises(SystemExit):
+        cli._main()
+    assert finished == [True]
+
+
+def test_several_configs_run_in_order(monkeypatch, config_dir, capsys):
+    """Every config is validated, then ingested one after another."""
+    ran = []
+
+    def fake_run(ingest_config, rag_config):
+        ran.append((ingest_config.collection_name, ingest_config.file_paths, ingest_config.rebuild))
+        return 5
+
+    monkeypatch.setattr(cli, "_run_config", fake_run)
+    _run_cli(
+        monkeypatch, config_dir,
+        "-c", str(config_dir / "a.yaml"), str(config_dir / "c.yaml"), "--no-rebuild",
+    )
+    assert ran == [("shared", ["a.txt"], False), ("other", ["c.txt"], False)]
+    out = capsys.readouterr().out
+    assert "[a.yaml] Ingestion complete: 5 chunks indexed" in out
+    assert "[c.yaml] Ingestion complete: 5 chunks indexed" in out
+
+
+def test_invalid_config_stops_before_any_ingestion(monkeypatch, config_dir, capsys):
+    """One malformed config fails the run before the others are ingested."""
+    (config_dir / "bad.yaml").write_text("file_paths: [a.txt]\n", encoding="utf-8")
+    monkeypatch.setattr(cli, "_run_config", lambda *a: pytest.fail("ingestion must not run"))
+    with pytest.raises(SystemExit):
+        _run_cli(monkeypatch, config_dir, "-c", str(config_dir / "a.yaml"), str(config_dir / "bad.yaml"))
+    assert "Ingestion configuration error" in capsys.readouterr().out
+
+
+def test_workers_dispatches_configs_in_parallel(monkeypatch, config_dir):
+    """With --workers, configs for different collections go to the process pool."""
+    dispatched = []
+    monkeypatch.setattr(
+        cli, "_run_parallel",
+        lambda paths, configs, rag_config, workers: dispatched.append(
+            ([p.name for p in paths], [c.collection_name for c in configs], workers)
+        ),
+    )
+    _run_cli(
+        monkeypatch, config_dir,
+        "-c", str(config_dir / "a.yaml"), str(config_dir / "c.yaml"), "-w", "2",
+    )
+    assert dispatched == [(["a.yaml", "c.yaml"], ["shared", "other"], 2)]
+
+
+def test_parallel_run_creates_chroma_store_before_workers(monkeypatch, config_dir, capsys):
+    """The persist directory is set up once in the parent before the pool starts."""
+    rag_config = RagConfig.from_yaml(config_dir / "rag_config.yaml")
+    persist_dir = config_dir / "chroma"
+    pool_saw_store = []
+
+    def thread_pool(max_workers):
+        pool_saw_store.append(persist_dir.is_dir())
+        return ThreadPoolExecutor(max_workers)
+
+    monkeypatch.setattr(ingest, "_process_pool", thread_pool)
+    monkeypatch.setattr(cli, "_run_config", lambda ingest_config, rag: 1)
+    configs = [SimpleNamespace(collection_name=name) for name in ("shared", "other")]
+    cli._run_parallel([config_dir / "a.yaml", config_dir / "c.yaml"], configs, rag_config, 2)
+
+    assert pool_saw_store == [True]
+    assert capsys.readouterr().out.count("Ingestion complete: 1 chunks indexed") == 2
+
+
+def test_load_ingest_data_yaml_and_toml(tmp_path):
+    """YAML and TOML configs parse to the same document; an empty YAML is None."""
+    (tmp_path / "docs.yaml").write_text(
+        "collection_name: docs\nfile_paths:\n  - a.txt\n  - b.txt\nmetadata:\n  domain: fa\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "docs.toml").write_text(
+        'collection_name = "docs"\nfile_paths = ["a.txt", "b.txt"]\n\n[metadata]\ndomain = "fa"\n',
+        encoding="utf-8",
+    )
+    (tmp_path / "empty.yaml").write_text("", encoding="utf-8")
+
+    expected = {"collection_name": "docs", "file_paths": ["a.txt", "b.txt"], "metadata": {"domain": "fa"}}
+    assert cli._load_ingest_data(tmp_path / "docs.yaml") == expected
+    assert cli._load_ingest_data(tmp_path / "docs.toml") == expected
+    assert cli._load_ingest_data(tmp_path / "empty.yaml") is None
+
+
+def test_toml_config_runs(monkeypatch, config_dir):
+    """A TOML ingestion config can be mixed with YAML ones on the command line."""
+    (config_dir / "d.toml").write_text(
+        'collection_name = "toml_docs"\nfile_paths = ["d.txt"]\n', encoding="utf-8"
+    )
+    ran = []
+    monkeypatch.setattr(
+        cli, "_run_config", lambda ingest_config, rag_config: ran.append(ingest_config.collection_name) or 0
+    )
+    _run_cli(monkeypatch, config_dir, "-c", str(config_dir / "d.toml"), str(config_dir / "c.yaml"))
+    assert ran == ["toml_docs", "other"]
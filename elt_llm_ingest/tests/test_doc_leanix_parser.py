@@ -0,0 +1,130 @@
+"""Tests for the LeanIX draw.io XML extractor.
+
+Usage:
+    uv run pytest elt_llm_ingest/tests/test_doc_leanix_parser.py
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from elt_llm_ingest.doc_leanix_parser import (
+    LeanIXExtractor,
+    extract_leanix_file,
+    extract_leanix_files,
+)
+
+SAMPLE_XML = """<mxfile><diagram id="d" name="Page-1"><mxGraphModel><root>
+  <mxCell id="0"/>
+  <mxCell id="1" parent="0"/>
+  <mxCell id="g1" style="group" vertex="1" parent="1"/>
+  <object id="a1" type="factSheet" label="&lt;b&gt;PARTY&lt;/b&gt;" factSheetType="DataObject" factSheetId="fs-party">
+    <mxCell style="rounded=1;" vertex="1" parent="g1"><mxGeometry x="0" y="0" width="600" height="30" as="geometry"/></mxCell>
+  </object>
+  <object id="a2" type="factSheet" label="Individuals" factSheetType="DataObject" factSheetId="fs-ind">
+    <mxCell vertex="1" parent="g1"><mxGeometry x="10" y="40" width="300" height="200" as="geometry"/></mxCell>
+  </object>
+  <object id="a3" type="factSheet" label="Player" factSheetType="DataObject" factSheetId="fs-player">
+    <mxCell vertex="1" parent="g1"><mxGeometry x="20" y="60" width="100" height="40" as="geometry"/></mxCell>
+  </object>
+  <object id="a4" type="factSheet" label="Club &amp;amp;&amp;nbsp;Team" factSheetType="DataObject" factSheetId="fs-club">
+    <mxCell vertex="1" parent="g1"><mxGeometry x="400" y="60" width="100" height="40" as="geometry"/></mxCell>
+  </object>
+  <object id="g2" type="factSheet" label="wrapper" factSheetType="DataObject" factSheetId="fs-wrap">
+    <mxCell style="whiteSpace=wrap;group;" vertex="1" parent="1"/>
+  </object>
+  <object id="b1" type="factSheet" label="AGREEMENTS" factSheetType="DataObject" factSheetId="fs-agr">
+    <mxCell vertex="1" parent="g2"><mxGeometry x="0" y="0" width="300" height="30" as="geometry"/></mxCell>
+  </object>
+  <object id="b2" type="factSheet" label="Contract" factSheetType="DataObject" factSheetId="fs-contract">
+    <mxCell vertex="1" parent="g2"><mxGeometry x="10" y="40" width="100" height="40" as="geometry"/></mxCell>
+  </object>
+  <object id="d1" type="factSheet" label="CHANNEL" factSheetType="DataObject" factSheetId="fs-channel">
+    <mxCell vertex="1" parent="1"><mxGeometry x="1200" y="0" width="600" height="400" as="geometry"/></mxCell>
+  </object>
+  <object id="d2" type="factSheet" label="Email" factSheetType="DataObject" factSheetId="fs-email">
+    <mxCell vertex="1" parent="1"><mxGeometry x="1220" y="60" width="100" height="40" as="geometry"/></mxCell>
+  </object>
+  <object id="u1" type="factSheet" label="Season Ticket Account" factSheetType="DataObject" factSheetId="fs-u1">
+    <mxCell vertex="1" parent="1"/>
+  </object>
+  <mxCell id="e1" style="edgeStyle=entityRelationEdgeStyle;startArrow=ERoneToOne;endArrow=ERzeroToMany;" edge="1" parent="1" source="a1" target="b1"/>
+  <mxCell id="e2" style="edgeStyle=orthogonalEdgeStyle;" edge="1" parent="1" source="a1" target="missing"/>
+  <mxCell id="e3" style="startArrow=ERoneToMany;" edge="1" parent="1" source="a4" target="b2"/>
+</root></mxGraphModel></diagram></mxfile>
+"""
+
+
+@pytest.fixture
+def extractor(tmp_path) -> LeanIXExtractor:
+    xml_file = tmp_path / "model.xml"
+    xml_file.write_text(SAMPLE_XML, encoding="utf-8")
+    ex = LeanIXExtractor(str(xml_file), model_name="Test Model", org_name="Org")
+    ex.parse_xml()
+    ex.extract_all()
+    return ex
+
+
+def test_groups_detected(extractor):
+    """Bare (Type 1), object-wrapped (Type 2) and geometry-only (Type 3) domains are found."""
+    assert extractor.groups == {"g1": "PARTY", "g2": "AGREEMENTS", "d1": "CHANNEL"}
+    # Object-wrapped container and Type 3 domain root are structural, not assets
+    assert "g2" not in extractor.assets
+    assert "d1" not in extractor.assets
+
+
+def test_assets_and_subgroups(extractor):
+    """Assets carry their domain, cleaned label and visual subgroup."""
+    player = extractor.assets["a3"]
+    assert player.parent_group == "PARTY"
+    assert player.subgroup == "Individuals"
+    assert extractor.assets["a4"].label == "Club & Team"
+    assert extractor.assets["a4"].subgroup is None
+    assert extractor.assets["d2"].parent_group == "CHANNEL"
+    assert extractor.assets["u1"].parent_group is None
+
+
+def test_relationships(extractor):
+    """Edges to unknown endpoints are dropped; labels and cardinality are filled in."""
+    rels = {r.id: r for r in extractor.relationships}
+    assert set(rels) == {"e1", "e3"}
+    assert rels["e1"].source_label == "PARTY"
+    assert rels["e1"].target_label == "AGREEMENTS"
+    assert rels["e1"].relationship_type == "Entity Relationship"
+    assert rels["e1"].cardinality == "1..1-0..*"
+    assert rels["e3"].cardinality == "1..*-"
+    assert rels["e3"].relationship_type is None
+
+
+def test_section_files(extractor):
+    """Split-mode output has one section per domain plus overview/extras/relationships."""
+    sections = extractor.to_section_files()
+    assert set(sections) == {
+        "overview", "party", "agreements", "channel", "additional_entities", "relationships",
+    }
+    assert "- **Player** *(LeanIX ID: `fs-player`)*" in sections["party"]
+    assert "**Account Types (1 entities):** Season Ticket Account." in sections["additional_entities"]
+    assert "**PARTY** relates to (exactly one to zero or more) **AGREEMENTS**." in sections["relationships"]
+
+
+def test_extract_leanix_file_rejects_unknown_format(tmp_path):
+    """An unknown format is an error rather than a "None" path."""
+    xml_file = tmp_path / "model.xml"
+    xml_file.write_text(SAMPLE_XML, encoding="utf-8")
+    with pytest.raises(ValueError, match="xlsx"):
+        extract_leanix_file(str(xml_file), str(tmp_path / "out"), format="xlsx")
+    assert extract_leanix_file(str(xml_file), str(tmp_path / "out.md"), format="md") == str(tmp_path / "out.md")
+
+
+def test_extract_leanix_files_rejects_clashing_stems(tmp_path):
+    """Same-named inputs from different directories are refused up front."""
+    inputs = []
+    for sub in ("a", "b"):
+        (tmp_path / sub).mkdir()
+        xml_file = tmp_path / sub / "model.xml"
+        xml_file.write_text(SAMPLE_XML, encoding="utf-8")
+        inputs.append(str(xml_file))
+
+    with pytest.raises(ValueError, match="would both be written"):
+        extract_leanix_files(inputs, str(tmp_path / "out"))
+    assert not (tmp_path / "out").exists()
@@ -0,0 +1,138 @@
+"""Tests for file hash change detection.
+
+Usage:
+    uv run pytest elt_llm_ingest/tests/test_file_hash.py
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import chromadb
+import pytest
+
+from elt_llm_ingest import file_hash, ingest
+from elt_llm_ingest.file_hash import (
+    compute_file_hash,
+    filter_changed_files,
+    get_stored_hash,
+    is_file_changed,
+    store_file_hashes,
+)
+
+COLLECTION = "docs"
+
+
+class _CountingCollection:
+    """Wraps the file_hashes collection, counting calls per method."""
+
+    def __init__(self, collection: chromadb.Collection) -> None:
+        self._collection = collection
+        self.calls: dict[str, int] = {}
+
+    def __getattr__(self, name: str):
+        attr = getattr(self._collection, name)
+        if callable(attr):
+            def counted(*args, **kwargs):
+                self.calls[name] = self.calls.get(name, 0) + 1
+                return attr(*args, **kwargs)
+            return counted
+        return attr
+
+
+@pytest.fixture
+def client(tmp_path) -> chromadb.ClientAPI:
+    return chromadb.PersistentClient(path=str(tmp_path / "chroma"))
+
+
+@pytest.fixture
+def hash_collection(client) -> _CountingCollection:
+    """The client's file_hashes collection, with call counting."""
+    spy = _CountingCollection(file_hash._get_hash_collection(client))
+    file_hash._HASH_COLLECTIONS[client] = spy
+    return spy
+
+
+@pytest.fixture
+def files(tmp_path) -> list[str]:
+    paths = []
+    for i in range(3):
+        path = tmp_path / f"doc{i}.txt"
+        path.write_text(f"document {i}", encoding="utf-8")
+        paths.append(str(path))
+    return paths
+
+
+def test_store_file_hashes_single_upsert(client, hash_collection, files):
+    """Hashes for many files are written in one upsert, with stat fields."""
+    store_file_hashes(client, [(fp, compute_file_hash(fp)) for fp in files], COLLECTION)
+
+    assert hash_collection.calls.get("upsert") == 1
+    for fp in files:
+        assert get_stored_hash(client, fp, COLLECTION) == compute_file_hash(fp)
+    stored = file_hash._get_stored_metadata(client, files[0], COLLECTION)
+    st = Path(files[0]).stat()
+    assert (stored["mtime_ns"], stored["size"]) == (st.st_mtime_ns, st.st_size)
+
+
+def test_filter_changed_files_single_lookup(client, hash_collection, files):
+    """New and modified files are reported, in order, from one stored-hash query."""
+    changed = filter_changed_files(client, files, COLLECTION)
+    assert changed == {fp: compute_file_hash(fp) for fp in files}
+    assert list(changed) == files
+    assert hash_collection.calls.get("get") == 1
+
+    store_file_hashes(client, [(fp, compute_file_hash(fp)) for fp in files], COLLECTION)
+    Path(files[1]).write_text("document 1, revised", encoding="utf-8")
+
+    hash_collection.calls.clear()
+    assert filter_changed_files(client, files, COLLECTION) == {files[1]: compute_file_hash(files[1])}
+    assert hash_collection.calls.get("get") == 1
+
+
+def test_unchanged_stat_skips_hashing(client, hash_collection, files, monkeypatch):
+    """Files whose mtime and size match the stored record are not read."""
+    store_file_hashes(client, [(fp, compute_file_hash(fp)) for fp in files], COLLECTION)
+
+    def no_hash(file_path):
+        raise AssertionError(f"{file_path} was hashed")
+
+    monkeypatch.setattr(file_hash, "compute_file_hash", no_hash)
+    assert filter_changed_files(client, files, COLLECTION) == {}
+    assert is_file_changed(client, files[0], COLLECTION) is False
+
+
+def test_touched_file_is_hashed_once_then_fast_pathed(client, hash_collection, files, monkeypatch):
+    """Same content with a new mtime is hashed, found unchanged and refreshed."""
+    store_file_hashes(client, [(fp, compute_file_hash(fp)) for fp in files], COLLECTION)
+    st = os.stat(files[0])
+    os.utime(files[0], ns=(st.st_atime_ns, st.st_mtime_ns + 10**9))
+
+    hashed = []
+    real_hash = file_hash.compute_file_hash
+
+    def counting_hash(file_path):
+        hashed.append(file_path)
+        return real_hash(file_path)
+
+    monkeypatch.setattr(file_hash, "compute_file_hash", counting_hash)
+    assert filter_changed_files(client, files, COLLECTION) == {}
+    assert hashed == [files[0]]
+
+    # The refreshed record now matches the new stat
+    assert filter_changed_files(client, files, COLLECTION) == {}
+    assert hashed == [files[0]]
+
+
+def test_iter_documents_stores_hashes_from_change_check(client, files, monkeypatch):
+    """Loaded files are recorded with the hashes the change check computed."""
+    def no_rehash(file_path):
+        raise AssertionError(f"{file_path} was hashed again")
+
+    monkeypatch.setattr(ingest, "compute_file_hash", no_rehash)
+    documents = list(ingest.iter_documents(files, chroma_client=client, collection_name=COLLECTION))
+
+    assert [doc.metadata["source_file"] for doc in documents] == files
+    for fp in files:
+        assert get_stored_hash(client, fp, COLLECTION) == compute_file_hash(fp)
@@ -0,0 +1,211 @@
+"""Tests for the ingestion pipeline helpers.
+
+Usage:
+    uv run pytest elt_llm_ingest/tests/test_ingest.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+
+import chromadb
+import pytest
+from llama_index.core import Document, MockEmbedding
+from llama_index.core.schema import NodeRelationship, TextNode
+
+from elt_llm_core.config import ChunkingConfig
+from elt_llm_ingest import ingest
+from elt_llm_ingest.ingest import (
+    _FILE_INFO_KEYS,
+    IngestConfig,
+    _add_to_collection,
+    _chunk_cache_key,
+    _embed_texts,
+    _get_splitter,
+    _process_pool,
+    _prune_chunk_cache,
+    _split_documents,
+    _split_documents_cached,
+    _splitter_args,
+)
+
+TABLE_TEXT = """Section 8 defines key terms used throughout the document.
+
+|Term|means|
+|---|---|
+|Club|a club playing football in England|
+|Player|any registered player|
+"""
+
+
+def test_add_to_collection_stores_none_metadata_as_empty_string():
+    """None metadata values are written as "" (Chroma rejects None)."""
+    collection = chromadb.EphemeralClient().get_or_create_collection("test_none_metadata")
+    nodes = [
+        TextNode(text="Club rules", metadata={"section": None, "page": 3}, embedding=[0.1, 0.2]),
+        TextNode(text="Player rules", metadata={"section": "8"}, embedding=[0.3, 0.4]),
+    ]
+
+    _add_to_collection(collection, nodes, batch_size=1)
+
+    stored = collection.get(ids=[nodes[0].node_id, nodes[1].node_id])
+    by_id = dict(zip(stored["ids"], stored["metadatas"]))
+    assert by_id[nodes[0].node_id]["section"] == ""
+    assert by_id[nodes[0].node_id]["page"] == 3
+    assert by_id[nodes[1].node_id]["section"] == "8"
+    assert sorted(stored["documents"]) == ["Club rules", "Player rules"]
+
+
+def test_embed_texts_without_and_inside_running_loop():
+    """Embedding works from plain code and from inside a running event loop."""
+    embed_model = MockEmbedding(embed_dim=4)
+    texts = ["a", "b", "c"]
+
+    async def embed_in_loop():
+        return _embed_texts(embed_model, texts)
+
+    assert len(_embed_texts(embed_model, texts)) == 3
+    in_loop = asyncio.run(embed_in_loop())
+    assert len(in_loop) == 3
+    assert all(len(vector) == 4 for vector in in_loop)
+
+
+def test_split_documents_through_pool_matches_in_process():
+    """Fresh (non-forked) workers build the splitter and chunk as in-process."""
+    chunking = ChunkingConfig(strategy="table_aware", chunk_size=256, chunk_overlap=20)
+    splitter_args = _splitter_args(chunking)
+    documents = [Document(text=f"Document {i}. " * 40 + TABLE_TEXT) for i in range(3)]
+
+    with _process_pool(2) as pool:
+        split = _split_documents(splitter_args, documents, pool)
+
+    splitter = _get_splitter(*splitter_args)
+    expected = [splitter.get_nodes_from_documents([doc]) for doc in documents]
+    assert [[n.text for n in nodes] for nodes in split] == [
+        [n.text for n in nodes] for nodes in expected
+    ]
+    assert all(len(nodes) > 1 for nodes in split)
+
+
+def _loaded_document(text: str, accessed: str, **metadata) -> Document:
+    """A document as _load_one returns it: file dates hidden from the splitter."""
+    return Document(
+        text=text,
+        metadata={"file_path": "/docs/rules.txt", "last_accessed_date": accessed, **metadata},
+        excluded_embed_metadata_keys=list(_FILE_INFO_KEYS),
+        excluded_llm_metadata_keys=list(_FILE_INFO_KEYS),
+    )
+
+
+def test_chunk_cache_key_ignores_hidden_metadata():
+    """Only text, chunking and metadata the splitter sees change the key."""
+    chunking = ChunkingConfig(strategy="table_aware")
+    key = _chunk_cache_key(chunking, _loaded_document("Rules.", "2026-01-01"))
+
+    assert _chunk_cache_key(chunking, _loaded_document("Rules.", "2026-02-02")) == key
+    assert _chunk_cache_key(chunking, _loaded_document("Other rules.", "2026-01-01")) != key
+    assert _chunk_cache_key(chunking, _loaded_document("Rules.", "2026-01-01", section="8")) != key
+    assert _chunk_cache_key(ChunkingConfig(strategy="table_aware", chunk_size=64),
+                            _loaded_document("Rules.", "2026-01-01")) != key
+
+
+def test_split_documents_cached_hit_and_miss(tmp_path, monkeypatch):
+    """A re-read unchanged document is served from the cache with fresh metadata."""
+    chunking = ChunkingConfig(strategy="table_aware", chunk_size=128, chunk_overlap=10)
+    splitter_args = _splitter_args(chunking)
+    text = "Club rules apply to every player. " * 30
+
+    used: set[str] = set()
+    first = _split_documents_cached(
+        splitter_args, [_loaded_document(text, "2026-01-01")], None, chunking, tmp_path, used
+    )
+    assert len(list(tmp_path.glob("*.pkl"))) == 1
+
+    # Hit: the splitter must not run again
+    def no_split(*args):
+        raise AssertionError("cache miss")
+
+    monkeypatch.setattr(ingest, "_split_documents", no_split)
+    reread = _loaded_document(text, "2026-02-02")
+    second = _split_documents_cached(splitter_args, [reread], None, chunking, tmp_path, set())
+    assert [n.text for n in second] == [n.text for n in first]
+    assert all(n.metadata["last_accessed_date"] == "2026-02-02" for n in second)
+    assert all(
+        n.relationships[NodeRelationship.SOURCE].node_id == reread.doc_id for n in second
+    )
+
+    # Miss: changed text is split and cached under a new key
+    monkeypatch.undo()
+    used = set()
+    _split_documents_cached(
+        splitter_args, [_loaded_document(text + " Amended.", "2026-02-02")], None,
+        chunking, tmp_path, used,
+    )
+    assert len(list(tmp_path.glob("*.pkl"))) == 2
+
+    _prune_chunk_cache(tmp_path, used)
+    assert [p.stem for p in tmp_path.glob("*.pkl")] == list(used)
+
+
+@pytest.mark.parametrize(
+    "data, message",
+    [
+        (["collection_name"], "must be a YAML dictionary"),
+        ({"collection_name": "a", "collection_prefix": "b"}, "must not set both"),
+        ({"file_paths": ["a.txt"]}, "either 'collection_name' or 'collection_prefix'"),
+        ({"collection_name": "a", "file_paths": "a.txt"}, "'file_paths' must be a list"),
+        ({"collection_name": "a", "file_paths": ["a.txt", 3]}, "'file_paths' must be a list"),
+        ({"collection_name": "a", "metadata": ["x"]}, "'metadata' must be a mapping"),
+    ],
+)
+def test_ingest_config_from_dict_rejects_malformed(data, message):
+    """Malformed ingestion configs are reported up front."""
+    with pytest.raises(ValueError, match=message):
+        IngestConfig.from_dict(data)
+
+
+def test_ingest_config_from_dict_overrides_and_prefix():
+    """CLI overrides win (None is ignored); the prefix reaches the preprocessor."""
+    config = IngestConfig.from_dict(
+        {"collection_name": "docs", "file_paths": ["a.txt"], "metadata": {"domain": "fa"}},
+        collection_name="other",
+        rebuild=False,
+        force=None,
+    )
+    assert (config.collection_name, config.rebuild, config.force) == ("other", False, False)
+    assert config.file_paths == ["a.txt"]
+    assert config.metadata == {"domain": "fa"}
+
+    split = IngestConfig.from_dict(
+        {"collection_prefix": "fa_leanix", "preprocessor": {"module": "m", "class": "C"}}
+    )
+    assert split.collection_name is None
+    assert split.file_paths == []
+    assert split.preprocessor.collection_prefix == "fa_leanix"
+
+
+def test_ingest_config_from_dict_rejects_collection_override_for_prefix():
+    """A collection name would be ignored by split ingestion, so it is refused."""
+    with pytest.raises(ValueError, match="cannot override a 'collection_prefix' config"):
+        IngestConfig.from_dict({"collection_prefix": "fa_leanix"}, collection_name="other")
+
+
+def test_ingest_from_config_validates_through_from_dict(tmp_path, monkeypatch):
+    """Prefix configs load (no KeyError) and the config's rebuild flag is kept."""
+    runs = []
+    monkeypatch.setattr(ingest, "run_ingestion", lambda config, rag: runs.append(config) or (None, 0))
+
+    split_path = tmp_path / "split.yaml"
+    split_path.write_text("collection_prefix: fa_leanix\nrebuild: false\n")
+    ingest.ingest_from_config(split_path, rag_config=object())
+    assert (runs[0].collection_prefix, runs[0].collection_name, runs[0].rebuild) == (
+        "fa_leanix",
+        None,
+        False,
+    )
+
+    bad_path = tmp_path / "bad.yaml"
+    bad_path.write_text("collection_name: docs\nfile_paths: a.txt\n")
+    with pytest.raises(ValueError, match="'file_paths' must be a list"):
+        ingest.ingest_from_config(bad_path, rag_config=object())
+    assert len(runs) == 1
@@ -0,0 +1,113 @@
+"""Tests for the LeanIX inventory Excel preprocessor.
+
+Usage:
+    uv run pytest elt_llm_ingest/tests/test_preprocessor.py
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import openpyxl
+import pytest
+
+from elt_llm_ingest.preprocessor import LeanIXInventoryPreprocessor, _InventoryRow
+
+HEADER = ["id", "type", "name", "displayName", "description", "level", "status", "lxState"]
+ROWS = [
+    ["fs-1", "DataObject", "Player", None, "A registered player ", 1, "active", "APPROVED"],
+    [None, None, None, None, None, None, None, None],
+    ["fs-2", "Interface", "CRM to Finance LI", None, None, None, "active", None],
+    ["fs-3", "Application", None, "Ticketing", "Sells tickets", 2, "active", "BROKEN_QUALITY_SEAL"],
+    ["fs-4", "Unknown", "Ignored", None, None, None, None, None],
+]
+
+
+def _write_workbook(path: Path, header: list, rows: list[list]) -> Path:
+    """Write an export-shaped workbook: a ReadMe sheet, then the data sheet."""
+    wb = openpyxl.Workbook()
+    wb.active.title = "ReadMe"
+    wb.active.append(["Exported from LeanIX"])
+    ws = wb.create_sheet("Export 2026-01-01 10-00")
+    ws.append(header)
+    for row in rows:
+        ws.append(row)
+    wb.save(path)
+    return path
+
+
+@pytest.fixture
+def inventory_xlsx(tmp_path) -> Path:
+    return _write_workbook(tmp_path / "inventory.xlsx", HEADER, ROWS)
+
+
+def test_preprocess_groups_rows_by_type(inventory_xlsx, tmp_path):
+    """Each known type gets its own section file and collection; the JSON covers every row."""
+    pre = LeanIXInventoryPreprocessor(collection_prefix="inv", org_name="Org")
+    result = pre.preprocess(inventory_xlsx, tmp_path / "out" / "inventory")
+
+    assert result.success, result.message
+    sections = {Path(f).name: c for f, c in result.section_collection_map.items()}
+    assert sections == {
+        "application.md": "inv_application",
+        "dataobject.md": "inv_dataobject",
+        "interface.md": "inv_interface",
+    }
+    dataobject = (tmp_path / "out" / "inventory_sections" / "dataobject.md").read_text(encoding="utf-8")
+    assert "Org LeanIX inventory contains 1 DataObject fact sheets" in dataobject
+    assert "Player" in dataobject and "A registered player" in dataobject
+
+    inventory = json.loads((tmp_path / "inventory_inventory.json").read_text(encoding="utf-8"))
+    assert set(inventory["fact_sheets"]) == {"fs-1", "fs-2", "fs-3", "fs-4"}
+    assert inventory["fact_sheets"]["fs-3"] == {
+        "id": "fs-3",
+        "type": "Application",
+        "name": "Ticketing",
+        "description": "Sells tickets",
+        "level": "2",
+        "status": "BROKEN_QUALITY_SEAL",
+    }
+
+
+def test_iter_excel_reads_only_row_fields(tmp_path):
+    """Only _InventoryRow columns are read; absent ones are "", duplicates keep the last."""
+    xlsx = _write_workbook(
+        tmp_path / "odd.xlsx",
+        ["type", "id", "name", "extra", "name", "description"],
+        [
+            ["DataObject", "a", "first", "x", "second", "d1"],
+            [None, None, None, "only extra", None, None],
+            ["Interface", None, "X to Y LI"],
+        ],
+    )
+
+    rows = list(LeanIXInventoryPreprocessor._iter_excel(xlsx))
+
+    assert rows == [
+        _InventoryRow(id="a", type="DataObject", name="second", displayName="",
+                      description="d1", level="", lxState=""),
+        _InventoryRow(id=None, type="Interface", name=None, displayName="",
+                      description=None, level="", lxState=""),
+    ]
+
+
+def test_iter_excel_openpyxl_fallback(inventory_xlsx, monkeypatch):
+    """Without python-calamine, rows are read through openpyxl."""
+    monkeypatch.setitem(sys.modules, "python_calamine", None)
+    rows = list(LeanIXInventoryPreprocessor._iter_excel(inventory_xlsx))
+    assert [r.id for r in rows] == ["fs-1", "fs-2", "fs-3", "fs-4"]
+    assert rows[0].level == 1
+
+
+def test_iter_excel_calamine_matches_openpyxl(inventory_xlsx, monkeypatch):
+    """python-calamine rows are normalised to exactly what openpyxl yields."""
+    pytest.importorskip("python_calamine")
+    with_calamine = list(LeanIXInventoryPreprocessor._iter_excel(inventory_xlsx))
+
+    monkeypatch.setitem(sys.modules, "python_calamine", None)
+    with_openpyxl = list(LeanIXInventoryPreprocessor._iter_excel(inventory_xlsx))
+
+    assert with_calamine == with_openpyxl
+    assert type(with_calamine[0].level) is int
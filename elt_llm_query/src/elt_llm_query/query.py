@@ -17,6 +17,7 @@ from elt_llm_core.vector_store import (
     create_storage_context,
     get_docstore_path,
     list_collections_by_prefix,
+    load_docstore_nodes,
 )
 
 logger = logging.getLogger(__name__)
@@ -151,7 +152,6 @@ def discover_relevant_sections(
         Returns empty list if BM25 is unavailable or no sections score above threshold.
     """
     try:
-        from llama_index.core import StorageContext
         from llama_index.retrievers.bm25 import BM25Retriever
         import logging as _logging
         _logging.getLogger("bm25s").setLevel(_logging.WARNING)
@@ -180,8 +180,7 @@ def discover_relevant_sections(
             continue
 
         try:
-            storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
-            nodes = list(storage.docstore.docs.values())
+            nodes = load_docstore_nodes(docstore_path)
             if not nodes:
                 continue
 
@@ -238,8 +237,6 @@ def find_sections_by_keyword(
           - chunk_texts:   deduplicated chunk texts that contain term (all matching
                            chunks across all sections, preserving order of discovery)
     """
-    from llama_index.core import StorageContext
-
     all_collections = resolve_collection_prefixes([section_prefix], rag_config)
     section_pat = re.compile(rf'^{re.escape(section_prefix)}_s\d{{2}}$')
     section_collections = [c for c in all_collections if section_pat.match(c)]
@@ -254,9 +251,8 @@ def find_sections_by_keyword(
         if not docstore_path.exists():
             continue
         try:
-            storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
             section_hit = False
-            for node in storage.docstore.docs.values():
+            for node in load_docstore_nodes(docstore_path):
                 text = getattr(node, "text", "") or ""
                 if term_lower in text.lower():
                     if not section_hit:
@@ -346,7 +342,6 @@ def _build_hybrid_retriever(
         return index.as_retriever(similarity_top_k=top_k)
 
     try:
-        from llama_index.core import StorageContext
         from llama_index.core.retrievers import QueryFusionRetriever
         from llama_index.retrievers.bm25 import BM25Retriever
 
@@ -354,8 +349,7 @@ def _build_hybrid_retriever(
         import logging as _logging
         _logging.getLogger("bm25s").setLevel(_logging.WARNING)
 
-        docstore_storage = StorageContext.from_defaults(persist_dir=str(docstore_path))
-        nodes = list(docstore_storage.docstore.docs.values())
+        nodes = load_docstore_nodes(docstore_path)
         logger.info("Loaded %d nodes from docstore at '%s'", len(nodes), docstore_path.resolve())
 
         if not nodes:
@@ -738,7 +732,6 @@ def query_collections(
         ``raw_response`` holds labeled per-section text (iterative mode only),
         and ``source_nodes`` contains all retrieved/loaded chunks.
     """
-    from llama_index.core import StorageContext
     from llama_index.core.response_synthesizers import get_response_synthesizer
     from llama_index.core.schema import NodeWithScore
 
@@ -762,8 +755,7 @@ def query_collections(
         docstore_path = get_docstore_path(rag_config.chroma, name)
         if full_ctx_threshold > 0 and docstore_path.exists():
             try:
-                ds = StorageContext.from_defaults(persist_dir=str(docstore_path))
-                doc_nodes = list(ds.docstore.docs.values())
+                doc_nodes = load_docstore_nodes(docstore_path)
                 if 0 < len(doc_nodes) <= full_ctx_threshold:
                     logger.info(
                         "Collection '%s': full-context mode (%d nodes ≤ threshold %d)",